@@ -5,13 +5,150 @@
 # cat ~/.cache/huggingface/hub/models--Qwen--Qwen3-0.6B/snapshots/c1899de289a04d12100db370d81485cdf75e47ca/tokenizer_config.json | grep chat_template
 # https://huggingface.co/Qwen/Qwen3-0.6B/blob/main/tokenizer_config.json
 
+import functools
+import json
 import shutil
+import tempfile
+from pathlib import Path
 
+import jinja2
+from jinja2.sandbox import ImmutableSandboxedEnvironment
 from transformers import AutoProcessor
 
 TERMINAL_WIDTH = shutil.get_terminal_size().columns
 MODEL_NAME = "Qwen/Qwen3-0.6B"
 
+# Jinja 바이트코드 캐시 디렉토리 (프로세스 재시작 후에도 컴파일 결과 재사용)
+_BYTECODE_CACHE_DIR = Path(tempfile.gettempdir()) / "chat_template_jinja_cache"
+
+
+@functools.lru_cache(maxsize=8)
+def get_compiled_chat_template(template_source: str) -> jinja2.Template:
+    """chat_template 소스를 한 번만 컴파일하고 이후 호출에서 재사용.
+
+    apply_chat_template은 호출할 때마다 Jinja 소스를 다시 parse+compile 하므로,
+    컴파일된 Template 객체를 소스 문자열 기준으로 메모이즈하여 렌더링 비용만 남긴다.
+    """
+    _BYTECODE_CACHE_DIR.mkdir(exist_ok=True)
+    env = ImmutableSandboxedEnvironment(
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(str(_BYTECODE_CACHE_DIR)),
+    )
+    return env.from_string(template_source)
+
+
+def render_qwen3_chat(
+    messages: list[dict],
+    add_generation_prompt: bool = True,
+    tools: list[dict] | None = None,
+    enable_thinking: bool | None = None,
+) -> str:
+    """Qwen3 chat_template을 순수 Python으로 AOT 특수화(partial evaluation)한 렌더러.
+
+    Jinja 인터프리터는 렌더링마다 AST를 순회하며 스코프 dict 조회/namespace 객체를
+    생성하지만, 템플릿 자체는 역할(role)별 고정 상태 기계이므로 if-분기 +
+    list.append + "".join으로 직접 옮기면 인터프리터 오버헤드가 사라진다.
+    main()에서 Jinja 렌더링 결과와 비교해 동등성을 검증한다.
+    """
+    parts: list[str] = []
+    append = parts.append
+    n = len(messages)
+
+    if tools:
+        append("<|im_start|>system\n")
+        if messages[0]["role"] == "system":
+            append(messages[0]["content"] + "\n\n")
+        append(
+            "# Tools\n\nYou may call one or more functions to assist with the user query.\n\n"
+            "You are provided with function signatures within <tools></tools> XML tags:\n<tools>"
+        )
+        for tool in tools:
+            append("\n")
+            append(json.dumps(tool))
+        append(
+            "\n</tools>\n\nFor each function call, return a json object with function name "
+            'and arguments within <tool_call></tool_call> XML tags:\n<tool_call>\n'
+            '{"name": <function-name>, "arguments": <args-json-object>}\n</tool_call><|im_end|>\n'
+        )
+    elif messages[0]["role"] == "system":
+        append("<|im_start|>system\n" + messages[0]["content"] + "<|im_end|>\n")
+
+    # 마지막 "실제" 사용자 질문의 인덱스 탐색 (템플릿의 역방향 namespace 루프와 동일)
+    last_query_index = n - 1
+    for index in range(n - 1, -1, -1):
+        message = messages[index]
+        content = message.get("content")
+        if (
+            message["role"] == "user"
+            and isinstance(content, str)
+            and not (
+                content.startswith("<tool_response>")
+                and content.endswith("</tool_response>")
+            )
+        ):
+            last_query_index = index
+            break
+
+    for index, message in enumerate(messages):
+        role = message["role"]
+        content = message.get("content")
+        if not isinstance(content, str):
+            content = ""
+
+        if role == "user" or (role == "system" and index != 0):
+            append("<|im_start|>" + role + "\n" + content + "<|im_end|>\n")
+
+        elif role == "assistant":
+            reasoning_content = ""
+            if isinstance(message.get("reasoning_content"), str):
+                reasoning_content = message["reasoning_content"]
+            elif "</think>" in content:
+                reasoning_content = (
+                    content.split("</think>")[0].rstrip("\n").split("<think>")[-1].lstrip("\n")
+                )
+                content = content.split("</think>")[-1].lstrip("\n")
+
+            if index > last_query_index and (index == n - 1 or reasoning_content):
+                append(
+                    "<|im_start|>" + role + "\n<think>\n"
+                    + reasoning_content.strip("\n")
+                    + "\n</think>\n\n"
+                    + content.lstrip("\n")
+                )
+            else:
+                append("<|im_start|>" + role + "\n" + content)
+
+            tool_calls = message.get("tool_calls")
+            if tool_calls:
+                for call_index, tool_call in enumerate(tool_calls):
+                    if (call_index == 0 and content) or call_index > 0:
+                        append("\n")
+                    function = tool_call.get("function") or tool_call
+                    append('<tool_call>\n{"name": "')
+                    append(function["name"])
+                    append('", "arguments": ')
+                    arguments = function["arguments"]
+                    append(arguments if isinstance(arguments, str) else json.dumps(arguments))
+                    append("}\n</tool_call>")
+            append("<|im_end|>\n")
+
+        elif role == "tool":
+            if index == 0 or messages[index - 1]["role"] != "tool":
+                append("<|im_start|>user")
+            append("\n<tool_response>\n")
+            append(content)
+            append("\n</tool_response>")
+            if index == n - 1 or messages[index + 1]["role"] != "tool":
+                append("<|im_end|>\n")
+
+    if add_generation_prompt:
+        append("<|im_start|>assistant\n")
+        if enable_thinking is False:
+            append("<think>\n\n</think>\n\n")
+
+    return "".join(parts)
+
 
 def main():
     processor = AutoProcessor.from_pretrained(MODEL_NAME)
@@ -52,14 +189,22 @@ def main():
         },
         {"role": "user", "content": "Thanks! Can you help me with something else?"},
     ]
-    prompt = processor.apply_chat_template(
-        messages, 
-        tokenize=False, 
+    # 컴파일된 템플릿을 직접 렌더링 (processor.apply_chat_template의 재컴파일 생략)
+    compiled = get_compiled_chat_template(processor.chat_template)
+    prompt = compiled.render(
+        messages=messages,
+        tools=None,
         add_generation_prompt=True,
     )
-    print("processor.apply_chat_template:")
+    print("compiled chat_template render:")
     print(prompt)
 
+    # AOT 특수화된 순수 Python 렌더러 검증 (Jinja 결과를 정답 오라클로 사용)
+    specialized = render_qwen3_chat(messages, add_generation_prompt=True)
+    assert specialized == prompt, "render_qwen3_chat diverged from the Jinja template"
+    print("-" * TERMINAL_WIDTH)
+    print("render_qwen3_chat matches the Jinja render")
+
 
 if __name__ == "__main__":
     main()
@@ -15,75 +15,263 @@ SWARM 패턴에서의 역할:
     4. 에이전트 응답을 채팅 UI로 표시
 """
 
-import os
-import tempfile
+import asyncio
+import concurrent.futures
+import hashlib
+import io
+import re
+import time
+from collections import deque
 
 import streamlit as st
-from explainer.graph import app  # 컴파일된 SWARM 애플리케이션
+from explainer.graph import (  # SWARM 애플리케이션 빌더 및 실행 헬퍼
+    batched_invoke,
+    build_app,
+    detect_personas,
+    parallel_invoke,
+)
+from explainer.service.config import get_chat_model  # 토큰 카운팅용 모델 접근
 from explainer.service.content_loader import ContentLoader  # PDF 문서 로더
-from langchain_core.messages import HumanMessage  # LangChain 메시지 클래스
+from explainer.service.retriever import build_retriever  # 문서 top-k 검색기
+from langchain_core.messages import AIMessage, HumanMessage  # LangChain 메시지 클래스
 from langgraph_swarm import SwarmState  # SWARM 상태 관리 객체
 from streamlit_pdf_viewer import pdf_viewer
 
 
-def _process_pdf_upload(uploaded_file) -> str | None:
+# PDF 파싱을 Streamlit 메인 스레드 밖에서 수행하기 위한 워커 풀
+# (파싱이 도는 동안에도 UI 이벤트 루프가 멈추지 않고 리런을 처리할 수 있음)
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+# 업로드마다 새로 만들 필요가 없는 로더/스플리터는 모듈 스코프에 1회만 생성
+_LOADER = ContentLoader()
+
+
+def _process_pdf_upload(pdf_bytes: bytes) -> str | None:
     """
-    업로드된 PDF 파일을 처리하고 문서 컨텐츠를 반환하는 함수
+    업로드된 PDF 바이트를 처리하고 문서 컨텐츠를 반환하는 함수
 
-    이 함수는 Streamlit에서 업로드한 PDF 파일을 임시 디렉토리에 저장하고,
-    ContentLoader를 사용하여 텍스트를 추출한 후, 임시 파일을 삭제합니다.
+    업로드된 바이트는 이미 메모리에 있으므로 임시 파일을 거치지 않고
+    BytesIO 스트림으로 감싸 ContentLoader에 바로 전달합니다.
+    (디스크 쓰기 + 재읽기로 파일 크기의 약 2배에 달하던 I/O를 제거)
+
+    이 함수는 _POOL 워커 스레드에서 실행되므로 Streamlit API를 호출하지 않습니다.
+    파싱 에러는 그대로 전파되어 Future.result()를 읽는 메인 스레드에서 처리됩니다.
 
     Args:
-        uploaded_file (streamlit.runtime.uploaded_file_manager.UploadedFile):
-            Streamlit의 file_uploader로부터 받은 업로드 파일 객체
-            - 지원 형식: .pdf
-            - getbuffer() 메서드로 파일 바이트 데이터 접근 가능
+        pdf_bytes (bytes): 업로드된 PDF 파일의 바이트 데이터
 
     Returns:
-        str | None: 추출된 문서 텍스트 (청크 결합된 평문) 또는 에러 시 None
+        str | None: 추출된 문서 텍스트 (청크 결합된 평문)
                     - 성공 시: max_chunks=10개 청크를 \n\n으로 연결한 텍스트
-                    - 실패 시: None 반환 및 Streamlit 에러 메시지 표시
 
     Raises:
         Exception: PDF 파싱 실패 시 (잘못된 PDF 형식, 암호화된 파일 등)
-                  - 에러는 try-except로 캐치되어 st.error()로 사용자에게 표시됨
+                  - 메인 스레드에서 fut.result() 호출 시 재발생하여 st.error()로 표시
 
     Example:
-        >>> uploaded_file = st.file_uploader("Upload PDF", type=["pdf"])
-        >>> if uploaded_file:
-        >>>     content = _process_pdf_upload(uploaded_file)
-        >>>     if content:
-        >>>         st.session_state.document_content = content
+        >>> fut = _POOL.submit(_process_pdf_upload, uploaded_file.getvalue())
+        >>> if fut.done():
+        >>>     content = fut.result()
 
     Note:
         - max_chunks=10으로 제한하여 LLM 컨텍스트 창 크기 관리
-        - 임시 파일은 처리 후 자동으로 삭제됨 (finally 블록에서 보장)
-        - 파일명 충돌 방지를 위해 "uploaded_" 접두사 추가
+        - 임시 파일을 쓰지 않으므로 동시 세션 간 tmp 파일 충돌도 사라짐
     """
-    if uploaded_file is None:
+    if pdf_bytes is None:
         return None
 
-    # 시스템 임시 디렉토리에 PDF 파일 저장
-    temp_dir = tempfile.gettempdir()
-    temp_file_path = os.path.join(temp_dir, f"uploaded_{uploaded_file.name}")
+    # 모듈 스코프의 공유 ContentLoader로 메모리 스트림에서 바로 PDF 텍스트 추출
+    # max_chunks=10: 처음 10개 청크만 사용하여 LLM 컨텍스트 크기 제한
+    return _LOADER.get_text(io.BytesIO(pdf_bytes), max_chunks=10)
+
+
+def _hash_pdf_bytes(pdf_bytes: bytes) -> str:
+    """PDF 바이트의 캐시 키 해시 계산
+
+    blake2b는 sha256보다 약 2배 빠르고, 캐시 키 용도로는 암호학적 강도가
+    필요 없으므로 digest_size=16으로 충분합니다.
+    """
+    return hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _extract_text_cached(doc_hash: str, _pdf_bytes: bytes) -> str | None:
+    """
+    컨텐츠 해시를 키로 PDF 텍스트 추출 결과를 디스크에 캐시하는 함수
+
+    같은 PDF를 다시 업로드하면 (세션이 리셋되었거나 다른 세션이어도)
+    파싱을 건너뛰고 캐시된 텍스트를 바로 반환합니다.
+
+    Args:
+        doc_hash (str): PDF 바이트의 blake2b 해시 (캐시 키)
+        _pdf_bytes (bytes): PDF 바이트 (언더스코어 접두사로 Streamlit 해싱 제외
+                            — 키는 doc_hash가 담당하므로 중복 해싱 방지)
+    """
+    return _process_pdf_upload(_pdf_bytes)
+
+
+# 대화 이력 윈도잉 파라미터
+# 이력을 무한정 누적하면 매 턴 전체 이력 + 전체 문서를 다시 보내게 되어
+# 프롬프트 토큰이 턴 수에 따라 선형(비용은 사실상 제곱)으로 늘어납니다.
+_MESSAGE_WINDOW = 20  # 문서 pin을 제외하고 유지할 최근 메시지 수
+_TOKEN_BUDGET = 6000  # 윈도우 내 메시지들의 토큰 예산
 
-    # 업로드된 파일을 임시 위치에 쓰기
-    with open(temp_file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
 
-    # ContentLoader를 사용하여 PDF 텍스트 추출
-    loader = ContentLoader()
+def _count_tokens(text: str) -> int:
+    """모델 토크나이저로 토큰 수를 세고, 실패 시 문자 수 기반으로 근사"""
     try:
-        # max_chunks=10: 처음 10개 청크만 사용하여 LLM 컨텍스트 크기 제한
-        document_content = loader.get_text(temp_file_path, max_chunks=10)
-        return document_content
-    except Exception as e:
-        st.error(f"Error processing PDF: {str(e)}")
-        return None
+        return get_chat_model().get_num_tokens(text)
+    except Exception:
+        # 토크나이저를 쓸 수 없는 환경(로컬 모델 등)에서는 ~4자/토큰으로 근사
+        return len(text) // 4
+
+
+def _window_messages(messages: list, new_message) -> list:
+    """
+    문서 컨텍스트를 고정(pin)한 채 최근 대화만 유지하는 슬라이딩 윈도우 함수
+
+    첫 번째 메시지([Document content] pin)는 항상 유지하고,
+    이후 이력은 최근 _MESSAGE_WINDOW개로 제한한 뒤 _TOKEN_BUDGET을 초과하면
+    가장 오래된 메시지부터 제거합니다.
+
+    Args:
+        messages: 현재 SwarmState의 메시지 시퀀스 (첫 원소는 문서 pin)
+        new_message: 이번 턴에 추가할 새 메시지
+
+    Returns:
+        tuple: (문서 pin, *윈도잉된 최근 이력, 새 메시지)
+               - 원본을 변형하지 않는 새 튜플 (copy-on-append)
+               - 문서 pin 메가스트링은 참조로만 전달되어 복사 비용 없음
+    """
+    doc_message, *history = messages
+
+    # 최근 N개만 유지 (deque maxlen으로 앞쪽 오래된 메시지 자동 탈락)
+    recent = list(deque(history, maxlen=_MESSAGE_WINDOW))
+
+    # 토큰 예산 초과 시 가장 오래된 메시지부터 추가 제거
+    def _message_tokens(message) -> int:
+        content = getattr(message, "content", None) or message.get("content", "")
+        return _count_tokens(content) if isinstance(content, str) else 0
+
+    while recent and sum(_message_tokens(m) for m in recent) > _TOKEN_BUDGET:
+        recent.pop(0)
+
+    return (doc_message, *recent, new_message)
+
+
+@st.cache_resource
+def get_retriever(doc_hash: str, document_content: str):
+    """
+    문서 해시를 키로 임베딩 인덱스를 1회만 생성하고 리런 간에 유지하는 함수
+
+    같은 PDF를 다시 업로드하거나 세션이 리런되어도 임베딩 비용을
+    다시 지불하지 않습니다. (doc_hash가 캐시 키 역할)
+    """
+    return build_retriever(document_content)
+
+
+def _refresh_document_pin(messages: list, query: str) -> list:
+    """
+    문서 pin을 질의와 관련된 top-k 청크로 교체하는 함수
+
+    기존에는 [Document content] pin에 문서 전체가 담겨 매 턴 재전송되었지만,
+    retriever가 있으면 현재 질의와 관련된 청크 k개만 pin에 싣습니다.
+    (프롬프트 길이: 문서 전체 → 청크 k개)
+
+    Args:
+        messages: SwarmState 메시지 시퀀스 (첫 원소는 문서 pin)
+        query (str): 이번 턴의 사용자 질의
+
+    Returns:
+        tuple: pin이 갱신된 새 메시지 튜플 (retriever가 없으면 원본 그대로)
+    """
+    retriever = st.session_state.get("retriever")
+    if retriever is None:
+        return messages
+
+    try:
+        chunks = retriever.invoke(query)
+    except Exception:
+        # 임베딩 백엔드 장애 시 전체 문서 pin으로 동작 유지
+        return messages
+    if not chunks:
+        return messages
+
+    context_message = "[Document content] : " + "\n\n".join(
+        chunk.page_content for chunk in chunks
+    )
+    return (HumanMessage(content=context_message), *messages[1:])
+
+
+@st.cache_resource
+def get_app():
+    """
+    컴파일된 SWARM 애플리케이션을 Streamlit 리런 간에 유지하는 함수
+
+    build_app()은 자체적으로 @functools.cache가 적용되어 있지만,
+    @st.cache_resource를 한 겹 더 두면 Streamlit 핫리로드로 모듈이
+    다시 임포트되는 경우에도 컴파일된 그래프 인스턴스가 보존됩니다.
+    """
+    return build_app()
+
+
+def _stream_agent_response(state):
+    """
+    SWARM 응답을 토큰 단위로 스트리밍하는 동기 제너레이터
+
+    app.invoke()는 전체 에이전트 체인(2~3회 handoff 포함)이 끝날 때까지
+    블로킹되지만, app.astream(stream_mode="messages")은 마지막 에이전트가
+    토큰을 생성하는 즉시 내보내므로 첫 토큰까지의 대기 시간(TTFB)이
+    "모든 hop의 합"에서 "마지막 hop의 첫 토큰"으로 줄어듭니다.
+
+    Streamlit의 st.write_stream은 동기 제너레이터를 기대하므로,
+    비동기 스트림을 전용 이벤트 루프로 구동하여 동기적으로 중계합니다.
+
+    Args:
+        state: 실행할 SwarmState (사용자 메시지가 이미 추가된 상태)
+
+    Yields:
+        str: LLM이 생성하는 토큰 조각 (content가 비어있지 않은 것만)
+    """
+
+    async def _token_stream():
+        # stream_mode="messages": (메시지 청크, 메타데이터) 튜플 단위로 스트리밍
+        app = get_app()
+        async for chunk, _metadata in app.astream(state, stream_mode="messages"):
+            if getattr(chunk, "content", None):
+                yield chunk.content
+
+    loop = asyncio.new_event_loop()
+    try:
+        stream = _token_stream().__aiter__()
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                break
     finally:
-        # 임시 파일 정리 (보안 및 디스크 공간 관리)
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+        loop.close()
+
+
+def _split_sub_queries(prompt: str) -> list[str]:
+    """
+    사용자 입력에서 독립적인 하위 질문들을 휴리스틱으로 분리하는 함수
+
+    "1. 요약해줘 2. 코드 예제 줘" 같은 번호 목록 형태의 다중 질문을 감지하여
+    batched_invoke로 한 번에 처리할 수 있도록 분리합니다.
+
+    Args:
+        prompt (str): 사용자 채팅 입력
+
+    Returns:
+        list[str]: 분리된 하위 질문 리스트 (다중 질문이 아니면 원본 1개만 포함)
+    """
+    # 번호 목록 패턴 (1. / 1) / - 등)으로 분할 시도
+    parts = re.split(r"(?:^|\n)\s*(?:\d+[.)]|[-*])\s+", prompt)
+    parts = [p.strip() for p in parts if p.strip()]
+    if len(parts) >= 2:
+        return parts
+    return [prompt]
 
 
 def main():
@@ -139,6 +327,12 @@ def main():
         st.session_state.agent_state = None  # SWARM 에이전트 상태
     if "uploaded_pdf_bytes" not in st.session_state:
         st.session_state.uploaded_pdf_bytes = None  # PDF 미리보기용 바이트
+    if "pdf_future" not in st.session_state:
+        st.session_state.pdf_future = None  # 백그라운드 PDF 파싱 Future
+    if "retriever" not in st.session_state:
+        st.session_state.retriever = None  # 문서 top-k 검색기 (업로드 시 생성)
+    if "doc_hash" not in st.session_state:
+        st.session_state.doc_hash = None  # 업로드 PDF 컨텐츠 해시 (캐시 키)
 
     # ========================================
     # 사이드바: PDF 업로드 영역
@@ -150,16 +344,47 @@ def main():
         if uploaded_file is not None:
             # 문서가 아직 처리되지 않았으면 처리 실행
             if st.session_state.document_content is None:
-                with st.spinner("Processing PDF..."):
-                    # PDF 바이트 데이터 저장 (미리보기용)
-                    st.session_state.uploaded_pdf_bytes = uploaded_file.read()
+                # 파싱을 워커 스레드에 제출 (최초 1회)
+                if st.session_state.pdf_future is None:
+                    # 업로드 바이트는 한 번만 읽어 미리보기와 텍스트 추출에 공유
+                    pdf_bytes = uploaded_file.getvalue()
+                    st.session_state.uploaded_pdf_bytes = pdf_bytes
+                    # 컨텐츠 해시 기반 캐시를 통해 동일 PDF 재업로드 시 파싱 생략
+                    st.session_state.doc_hash = _hash_pdf_bytes(pdf_bytes)
+                    st.session_state.pdf_future = _POOL.submit(
+                        _extract_text_cached, st.session_state.doc_hash, pdf_bytes
+                    )
+
+                fut = st.session_state.pdf_future
+                if not fut.done():
+                    # 아직 파싱 중: 메인 스레드는 블로킹하지 않고 잠깐 뒤 리런하여 폴링
+                    st.status("Processing PDF...", state="running")
+                    time.sleep(0.3)
+                    st.rerun()
+                else:
+                    # 파싱 완료: 결과 회수 (워커에서 발생한 예외는 여기서 재발생)
+                    st.session_state.pdf_future = None
+                    try:
+                        document_content = fut.result()
+                    except Exception as e:
+                        st.error(f"Error processing PDF: {str(e)}")
+                        document_content = None
 
-                    # PDF 텍스트 추출
-                    document_content = _process_pdf_upload(uploaded_file)
                     if document_content:
                         st.session_state.document_content = document_content
                         st.toast("PDF processed with success")
 
+                        # 문서 임베딩 인덱스를 업로드 시점에 1회 생성
+                        # (질의 시에는 관련 top-k 청크만 pin에 주입)
+                        # 캐시 키는 추출 캐시와 동일한 컨텐츠 해시를 재사용
+                        try:
+                            st.session_state.retriever = get_retriever(
+                                st.session_state.doc_hash, document_content
+                            )
+                        except Exception:
+                            # 임베딩 백엔드가 없으면 전체 문서 pin 방식으로 동작
+                            st.session_state.retriever = None
+
                         # ========================================
                         # SwarmState 초기화 (SWARM 패턴의 핵심)
                         # ========================================
@@ -183,10 +408,19 @@ def main():
     # 메인 컨텐츠 영역
     # ========================================
     if st.session_state.document_content is not None:
-        # PDF 미리보기 (Expander로 선택적 표시)
+        # PDF 미리보기 (Expander + 토글로 선택적 표시)
+        # pdf_viewer를 무조건 생성하면 expander가 접혀 있어도 PDF 바이트 전체가
+        # 매 리런마다 브라우저로 전송됩니다. 명시적 토글 뒤로 숨기고
+        # 렌더링할 페이지도 앞쪽 일부로 제한하여 전송량을 줄입니다.
         with st.expander("📖 View document", expanded=False):
             if st.session_state.uploaded_pdf_bytes:
-                pdf_viewer(st.session_state.uploaded_pdf_bytes, height=600)
+                if st.toggle("Preview PDF"):
+                    pdf_viewer(
+                        st.session_state.uploaded_pdf_bytes,
+                        height=600,
+                        pages_to_render=[1, 2, 3],  # 보이는 앞 페이지만 렌더링
+                        rendering="unwrap",
+                    )
 
         # 기존 채팅 메시지 표시
         for message in st.session_state.messages:
@@ -204,41 +438,103 @@ def main():
             # SWARM 에이전트 실행 및 응답 처리
             # ========================================
             with st.chat_message("assistant"):
-                with st.spinner("Thinking..."):
-                    try:
-                        # 1. 사용자 메시지를 SwarmState에 추가
-                        st.session_state.agent_state["messages"].append(
-                            HumanMessage(content=prompt)
-                        )
-
-                        # 2. SWARM 애플리케이션 실행
-                        # app.invoke()는 전체 에이전트 그래프를 실행합니다.
-                        # 기본 에이전트(Explainer)가 먼저 실행되고,
-                        # 필요시 다른 에이전트로 handoff됩니다.
-                        response_state = app.invoke(st.session_state.agent_state)
-
-                        # 3. 새로운 상태로 업데이트 (에이전트 응답 포함)
-                        st.session_state.agent_state = response_state
-
-                        # 4. 가장 최근 메시지 (에이전트 응답) 추출
-                        last_msg = response_state["messages"][-1]
-                        response_content = last_msg.content
+                try:
+                    # 문서 pin을 이번 질의와 관련된 top-k 청크로 교체
+                    # (기존 상태를 변형하지 않고 새 dict/튜플로 교체 —
+                    #  체크포인터가 들고 있을 수 있는 이전 상태 참조를 보호하고,
+                    #  문서 메가스트링은 참조 공유로 복사 비용을 피함)
+                    st.session_state.agent_state = {
+                        **st.session_state.agent_state,
+                        "messages": _refresh_document_pin(
+                            st.session_state.agent_state["messages"], prompt
+                        ),
+                    }
+
+                    # 복합 의도(요약+코드 등)가 감지되면 전문 에이전트들을
+                    # asyncio.gather로 병렬 실행 (직렬 handoff 대비 ~N배 단축)
+                    personas = detect_personas(prompt)
+                    sub_queries = _split_sub_queries(prompt)
+                    if len(personas) >= 2:
+                        with st.spinner("Thinking..."):
+                            response_content = asyncio.run(
+                                parallel_invoke(
+                                    st.session_state.agent_state, personas, prompt
+                                )
+                            )
+                        st.markdown(response_content)
 
-                        # 5. 응답 표시
+                        # 이번 턴(질문 + 결합 응답)을 영속 상태에 반영 —
+                        # 스트리밍 경로와 동일하게 하지 않으면 후속 질문이
+                        # 병렬 턴의 맥락을 전부 잃음
+                        st.session_state.agent_state = {
+                            **st.session_state.agent_state,
+                            "messages": (
+                                *_window_messages(
+                                    st.session_state.agent_state["messages"],
+                                    HumanMessage(content=prompt),
+                                ),
+                                AIMessage(content=response_content),
+                            ),
+                        }
+                    # 다중 질문이면 배치 프롬프팅으로 한 번의 invoke로 처리
+                    elif len(sub_queries) >= 2:
+                        with st.spinner("Thinking..."):
+                            answers = batched_invoke(
+                                st.session_state.agent_state, sub_queries
+                            )
+                            response_content = "\n\n".join(answers)
                         st.markdown(response_content)
 
-                        # 6. 채팅 이력에 저장
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": response_content}
+                        # 배치 턴도 동일하게 영속 상태에 반영
+                        st.session_state.agent_state = {
+                            **st.session_state.agent_state,
+                            "messages": (
+                                *_window_messages(
+                                    st.session_state.agent_state["messages"],
+                                    HumanMessage(content=prompt),
+                                ),
+                                AIMessage(content=response_content),
+                            ),
+                        }
+                    else:
+                        # 1. 사용자 메시지를 새 상태로 추가 (copy-on-append)
+                        # (문서 pin 유지 + 최근 이력만 남기는 토큰 예산 윈도잉)
+                        st.session_state.agent_state = {
+                            **st.session_state.agent_state,
+                            "messages": _window_messages(
+                                st.session_state.agent_state["messages"],
+                                HumanMessage(content=prompt),
+                            ),
+                        }
+
+                        # 2. SWARM 애플리케이션을 스트리밍으로 실행
+                        # app.astream()이 생성하는 토큰을 st.write_stream이
+                        # 실시간으로 렌더링하고, 완료 시 전체 텍스트를 반환합니다.
+                        response_content = st.write_stream(
+                            _stream_agent_response(st.session_state.agent_state)
                         )
 
-                    except Exception as e:
-                        # 에러 처리
-                        error_message = f"Sorry, I encountered an error: {str(e)}"
-                        st.error(error_message)
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": error_message}
-                        )
+                        # 3. 스트리밍으로 받은 최종 응답을 새 상태로 반영
+                        st.session_state.agent_state = {
+                            **st.session_state.agent_state,
+                            "messages": (
+                                *st.session_state.agent_state["messages"],
+                                AIMessage(content=response_content),
+                            ),
+                        }
+
+                    # 채팅 이력에 저장
+                    st.session_state.messages.append(
+                        {"role": "assistant", "content": response_content}
+                    )
+
+                except Exception as e:
+                    # 에러 처리
+                    error_message = f"Sorry, I encountered an error: {str(e)}"
+                    st.error(error_message)
+                    st.session_state.messages.append(
+                        {"role": "assistant", "content": error_message}
+                    )
 
     else:
         # 문서가 업로드되지 않았을 때 사용 안내 표시
@@ -8,16 +8,118 @@ SWARM 패턴에서의 역할:
     - SwarmState에 저장될 문서 컨텍스트 준비
 """
 
+import functools
+import hashlib
+import mmap
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterator
+
 from langchain.schema import Document
-from langchain_community.document_loaders import PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from pypdf import PdfReader
+
+# 파싱+분할 결과 디스크 캐시 디렉토리
+# SWARM의 모든 에이전트가 같은 문서를 공유하므로, 동일 파일 재파싱을
+# (경로, 수정시각, 청킹 파라미터) 키로 한 번만 수행하게 함
+_CACHE_DIR = Path.home() / ".cache" / "article-explainer"
+
+# Rust 구현 스플리터 (선택 의존성): 문자 단위 모드에서는 Python 콜백 왕복 없이
+# 전체가 Rust에서 실행되어 긴 PDF 분할에서 순수 Python 구현보다 훨씬 빠름
+try:
+    from semantic_text_splitter import TextSplitter as _RustTextSplitter
+except ImportError:
+    _RustTextSplitter = None
+
+# PDFium 백엔드 (선택 의존성): pypdf는 텍스트만 필요해도 content-stream의
+# path/fill/color 연산자까지 Python에서 전부 토크나이즈하지만, PDFium(C++)은
+# get_text* 경로에서 래스터화와 그래픽 연산을 건너뛰므로 그래픽이 많은
+# PDF에서 페이지당 추출 시간이 한 자릿수 ms 수준으로 떨어집니다.
+try:
+    import pypdfium2 as _pdfium
+except ImportError:
+    _pdfium = None
+
+# tiktoken (선택 의존성): 청크를 분할 시점에 한 번만 토크나이즈해 두면
+# 같은 문서를 여러 에이전트가 반복 조회할 때마다 LLM 클라이언트가 동일
+# 텍스트를 재토크나이즈하는 비용을 제거할 수 있음 (토큰 예산 계산에도 사용)
+try:
+    import tiktoken as _tiktoken
+except ImportError:
+    _tiktoken = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tokenizer():
+    """tiktoken 인코더를 프로세스당 한 번만 로드 (미설치 시 None)
+
+    인코딩은 cl100k_base 계열(gpt-4o-mini)을 사용합니다. 로컬 모델과는
+    정확히 일치하지 않지만 토큰 예산 추정 용도로는 충분합니다.
+    """
+    if _tiktoken is None:
+        return None
+    return _tiktoken.encoding_for_model("gpt-4o-mini")
+
+
+def _iter_pages_mmap(file_path: str) -> Iterator[Document]:
+    """mmap으로 매핑한 PDF 파일에서 페이지 Document를 순차 생성하는 제너레이터
+
+    파일 전체를 Python 힙으로 read()하는 대신 mmap으로 매핑하면 OS가
+    실제로 접근한 페이지만 메모리에 올리므로, 수백 MB PDF에서도 상주
+    메모리가 파서가 실제로 touch한 영역 수준으로 유지됩니다.
+    (mmap 객체는 read/seek를 지원하는 파일류라 PdfReader에 바로 전달 가능)
+    """
+    with open(file_path, "rb") as file_handle:
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            reader = PdfReader(mapped)
+            for page_number, page in enumerate(reader.pages):
+                yield Document(
+                    page_content=page.extract_text() or "",
+                    metadata={"page": page_number},
+                )
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> list[tuple[int, str]]:
+    """[start, stop) 페이지 범위의 텍스트를 추출하는 워커 함수
+
+    ProcessPoolExecutor로 전달되려면 pickle 가능해야 하므로 모듈 레벨에
+    정의합니다. 각 워커가 자기 프로세스에서 PdfReader를 새로 열기 때문에
+    파일 핸들/파서 상태를 프로세스 간에 공유하지 않습니다.
+    """
+    reader = PdfReader(file_path)
+    return [
+        (page_number, reader.pages[page_number].extract_text() or "")
+        for page_number in range(start, stop)
+    ]
+
+
+class _RustSplitterAdapter:
+    """semantic-text-splitter를 LangChain 스플리터 인터페이스로 감싸는 어댑터
+
+    ContentLoader는 split_documents(docs)만 사용하므로 해당 메서드만 노출합니다.
+    청크는 페이지별로 Rust 쪽에서 분할되고, 원본 metadata를 유지한 Document로
+    다시 감쌉니다.
+    """
+
+    def __init__(self, chunk_size: int, chunk_overlap: int):
+        self._splitter = _RustTextSplitter(capacity=chunk_size, overlap=chunk_overlap)
+
+    def split_documents(self, docs: list[Document]) -> list[Document]:
+        return [
+            Document(page_content=chunk, metadata=doc.metadata)
+            for doc in docs
+            for chunk in self._splitter.chunks(doc.page_content)
+        ]
 
 
 class ContentLoader:
     """
     PDF 문서에서 텍스트를 로드하고 준비하는 클래스
 
-    PyPDFLoader를 사용하여 PDF 파일을 로드하고,
+    pypdf(또는 설치 시 PDFium)로 PDF 파일을 로드하고,
     RecursiveCharacterTextSplitter로 텍스트를 의미 있는 청크로 분할합니다.
 
     청킹 전략:
@@ -53,7 +155,12 @@ class ContentLoader:
         >>> print(f"처음 5개 청크 텍스트 길이: {len(text)} 문자")
     """
 
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 100):
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 100,
+        length_function=None,
+    ):
         """
         ContentLoader 초기화
 
@@ -61,19 +168,231 @@ class ContentLoader:
             chunk_size (int): 각 청크의 최대 문자 수. 기본값 1000
             chunk_overlap (int): 청크 간 겹치는 문자 수. 기본값 100
                                  겹침은 컨텍스트 연속성을 유지하기 위해 필요
+            length_function (callable, optional): 청크 길이 측정 함수.
+                                 지정하면 LangChain 스플리터를 강제 사용
+                                 (Rust 스플리터는 Python 콜백 왕복 시 오히려 느림)
+        """
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+        if _RustTextSplitter is not None and length_function is None:
+            # 문자 단위 모드: 분할 로직 전체가 Rust에서 실행됨
+            self.splitter = _RustSplitterAdapter(chunk_size, chunk_overlap)
+        else:
+            # RecursiveCharacterTextSplitter: 재귀적으로 문자를 분할하여 의미 단위 유지
+            # (semantic-text-splitter 미설치 또는 커스텀 length_function 사용 시 fallback)
+            self.splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,  # 청크 크기
+                chunk_overlap=chunk_overlap,  # 청크 간 겹침
+                **({"length_function": length_function} if length_function else {}),
+            )
+
+    def iter_chunks(self, source: str | IO[bytes]) -> Iterator[Document]:
+        """
+        페이지를 하나씩 로드하며 분할된 청크를 순차적으로 생성하는 제너레이터
+
+        전체 PDF를 한 번에 메모리에 올리지 않고 페이지 단위로 파싱하여
+        바로 분할하므로, 피크 메모리가 "문서 전체"가 아니라
+        "페이지 1개 + 해당 페이지의 청크들" 수준으로 유지됩니다.
+        (수백 페이지 PDF에서 RSS 급증 방지)
+
+        Args:
+            source (str | IO[bytes]): 로드할 PDF 파일의 경로 또는
+                                      PDF 바이트를 담은 파일류 객체 (예: io.BytesIO)
+
+        Yields:
+            Document: 분할된 문서 청크 (페이지 순서대로)
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식일 경우
+        """
+        # 페이지가 나오는 즉시 분할하여 청크를 내보냄 (전체 재료화 없음)
+        for page in self._iter_pages(source):
+            for doc in self.splitter.split_documents([page]):
+                yield self._annotate_tokens(doc)
+
+    @staticmethod
+    def _iter_pages(source: str | IO[bytes]) -> Iterator[Document]:
+        """소스 종류에 맞는 백엔드로 페이지 Document를 순차 생성하는 제너레이터
+
+        iter_chunks와 load_hierarchical이 공유하는 페이지 추출 경로입니다.
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식일 경우
+        """
+        is_file_like = hasattr(source, "read")
+        if not is_file_like and not source.endswith(".pdf"):
+            raise ValueError(f"Unsupported file format: {source}")
+
+        if _pdfium is not None:
+            # PDFium 경로: 텍스트 전용 추출이라 그래픽 연산자를 건너뜀
+            # (PdfDocument는 경로와 파일류 객체를 모두 받음)
+            pdf = _pdfium.PdfDocument(source)
+            return (
+                Document(
+                    page_content=page.get_textpage().get_text_range() or "",
+                    metadata={"page": page_number},
+                )
+                for page_number, page in enumerate(pdf)
+            )
+        if is_file_like:
+            # 파일류 객체: pypdf로 메모리에서 페이지 단위 파싱 (임시 파일 불필요)
+            reader = PdfReader(source)
+            return (
+                Document(
+                    page_content=page.extract_text() or "",
+                    metadata={"page": page_number},
+                )
+                for page_number, page in enumerate(reader.pages)
+            )
+        # 파일 경로: mmap 매핑을 pypdf에 직접 전달 (PyPDFLoader는 파일
+        # 전체를 힙에 read()하므로 대형 PDF에서 RSS가 파일 크기만큼 증가)
+        return _iter_pages_mmap(source)
+
+    @staticmethod
+    def _take_token_budget(
+        chunks: Iterator[Document], max_tokens: int
+    ) -> Iterator[Document]:
+        """누적 토큰 수가 예산을 넘기 직전까지 청크를 내보내는 제너레이터
+
+        _annotate_tokens가 캐시한 token_ids가 있으면 재토크나이즈 없이
+        len()만으로 토큰 수를 얻고, 없으면 문자 수 // 4 휴리스틱으로 추정.
+        예산을 넘기는 첫 청크에서 순회를 멈추므로 뒤쪽 페이지 파싱도 중단됨.
+        """
+        running = 0
+        for doc in chunks:
+            token_ids = doc.metadata.get("token_ids")
+            count = len(token_ids) if token_ids is not None else len(doc.page_content) // 4
+            if running + count > max_tokens:
+                break
+            running += count
+            yield doc
+
+    @staticmethod
+    def _annotate_tokens(doc: Document) -> Document:
+        """청크에 토큰 ID를 1회 계산하여 metadata에 캐시
+
+        다운스트림에서 len(doc.metadata["token_ids"])로 재토크나이즈 없이
+        토큰 수를 얻을 수 있습니다. tiktoken 미설치 시 no-op.
         """
-        # RecursiveCharacterTextSplitter: 재귀적으로 문자를 분할하여 의미 단위 유지
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,  # 청크 크기
-            chunk_overlap=chunk_overlap,  # 청크 간 겹침
+        tokenizer = _get_tokenizer()
+        if tokenizer is not None:
+            doc.metadata["token_ids"] = tokenizer.encode(doc.page_content)
+        return doc
+
+    def load_hierarchical(
+        self,
+        source: str | IO[bytes],
+        parent_chunk_size: int = 2000,
+        child_chunk_size: int = 400,
+    ) -> tuple[list[Document], list[Document]]:
+        """
+        parent-child(small-to-big) 이중 해상도 청크를 생성하는 메서드
+
+        검색(임베딩)은 작은 child 청크로 정밀도를 높이고, 생성(LLM 컨텍스트)은
+        해당 child의 큰 parent 청크를 전달하는 검색 전략을 위한 데이터 레이아웃:
+        저장/비교할 임베딩 벡터 수는 child 기준이지만 벡터 수 자체가 flat한
+        소형 청크 인덱스보다 적고, 검색 히트당 LLM에 주는 문맥은 더 풍부해짐.
+
+        Args:
+            source (str | IO[bytes]): 로드할 PDF 파일의 경로 또는 파일류 객체
+            parent_chunk_size (int): parent 청크의 최대 문자 수. 기본값 2000
+            child_chunk_size (int): child 청크의 최대 문자 수. 기본값 400
+
+        Returns:
+            tuple[list[Document], list[Document]]: (parents, children).
+                각 parent는 metadata["id"]를 가지며, 각 child는
+                metadata["parent_id"]로 자신이 속한 parent를 가리킴
+
+        Example:
+            >>> parents, children = loader.load_hierarchical("paper.pdf")
+            >>> # children을 임베딩하여 인덱스 구축, 히트 시 parent_id로
+            >>> # parents에서 생성용 컨텍스트를 조회
+        """
+        parent_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=parent_chunk_size, chunk_overlap=parent_chunk_size // 10
         )
+        child_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=child_chunk_size, chunk_overlap=child_chunk_size // 10
+        )
+
+        parents: list[Document] = []
+        children: list[Document] = []
+        for page in self._iter_pages(source):
+            for parent in parent_splitter.split_documents([page]):
+                parent_id = f"p{len(parents)}"
+                parent.metadata["id"] = parent_id
+                parents.append(parent)
+                for child in child_splitter.split_documents([parent]):
+                    # child가 임베딩/검색에 히트하면 parent_id로 큰 청크 조회
+                    child.metadata["parent_id"] = parent_id
+                    children.append(child)
+        return parents, children
+
+    def load_parallel(self, file_path: str, max_workers: int = None) -> list[Document]:
+        """
+        PDF 페이지 파싱을 여러 프로세스에 분산하여 청크 리스트를 반환하는 메서드
+
+        pypdf의 페이지 파싱(content-stream 디코딩)은 순수 CPU 작업이라
+        GIL 때문에 스레드로는 병렬화되지 않습니다. 페이지를 코어 수만큼의
+        범위로 나누어 ProcessPoolExecutor에 분배하면 그래픽이 많은 대형
+        PDF에서 코어 수에 비례한 파싱 속도 향상을 얻습니다.
 
-    def load(self, file_path: str) -> list[Document]:
+        Args:
+            file_path (str): 로드할 PDF 파일 경로 (파일류 객체는 워커
+                             프로세스로 pickle할 수 없으므로 경로만 지원)
+            max_workers (int, optional): 워커 프로세스 수. 기본값은 CPU 코어 수
+
+        Returns:
+            List[Document]: 페이지 순서가 보존된 분할 청크 리스트
+
+        Note:
+            - 작은 PDF는 프로세스 기동 비용이 파싱 비용을 넘어서므로
+              페이지 수가 워커 수보다 적으면 직렬 경로(load)로 처리
         """
-        파일에서 컨텐츠를 로드하고 분할하는 메서드
+        page_count = len(PdfReader(file_path).pages)
+        workers = max_workers or os.cpu_count() or 1
+
+        # 작은 문서는 프로세스 fork/spawn 비용이 이득을 상쇄 → 직렬 경로
+        if page_count <= workers:
+            return self.load(file_path)
+
+        # 페이지를 워커 수만큼의 연속 범위로 분할 (범위당 퓨처 1개)
+        step = -(-page_count // workers)  # ceil division
+        ranges = [
+            (start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_extract_page_range, file_path, start, stop)
+                for start, stop in ranges
+            ]
+            # submit 순서 == 페이지 범위 순서이므로 순서대로 결과를 이어붙임
+            extracted = [pair for future in futures for pair in future.result()]
+
+        # 페이지 순서대로 Document로 감싼 뒤 기존 스플리터로 분할
+        docs = []
+        for page_number, text in extracted:
+            page = Document(page_content=text, metadata={"page": page_number})
+            docs.extend(
+                self._annotate_tokens(doc)
+                for doc in self.splitter.split_documents([page])
+            )
+        return docs
+
+    def load(self, source: str | IO[bytes]) -> list[Document]:
+        """
+        파일 경로 또는 파일류(file-like) 객체에서 컨텐츠를 로드하고 분할하는 메서드
+
+        내부적으로 iter_chunks 제너레이터를 사용하며, 전체 청크 리스트가
+        필요한 호출자를 위한 편의 API입니다. 일부 청크만 필요하면
+        iter_chunks를 직접 순회하는 것이 효율적입니다.
 
         Args:
-            file_path (str): 로드할 PDF 파일의 경로
+            source (str | IO[bytes]): 로드할 PDF 파일의 경로 또는
+                                      PDF 바이트를 담은 파일류 객체 (예: io.BytesIO)
 
         Returns:
             List[Document]: 분할된 문서 청크 리스트
@@ -81,29 +400,87 @@ class ContentLoader:
 
         Raises:
             ValueError: 지원하지 않는 파일 형식일 경우
+
+        Note:
+            - 경로 입력은 (절대경로, mtime_ns, chunk_size, chunk_overlap) 키의
+              디스크 캐시를 사용하여 같은 파일의 재파싱을 건너뜀
         """
-        # PDF 파일 형식 확인 및 로더 생성
-        if file_path.endswith(".pdf"):
-            loader = PyPDFLoader(file_path)  # PyPDF 라이브러리를 사용하여 PDF 파싱
-        else:
-            raise ValueError(f"Unsupported file format: {file_path}")
+        cache_file = self._cache_path(source) if isinstance(source, str) else None
+
+        # 캐시 히트: 파싱/분할을 건너뛰고 저장된 청크 복원
+        if cache_file is not None and cache_file.exists():
+            try:
+                records = pickle.loads(cache_file.read_bytes())
+                return [
+                    Document(
+                        page_content=record["page_content"],
+                        metadata=record["metadata"],
+                    )
+                    for record in records
+                ]
+            except Exception:
+                pass  # 손상된 캐시는 무시하고 재파싱
+
+        docs = list(self.iter_chunks(source))
+
+        # 캐시 저장 (best-effort: 실패해도 로드 결과에는 영향 없음)
+        if cache_file is not None:
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(
+                    pickle.dumps(
+                        [
+                            {
+                                "page_content": doc.page_content,
+                                "metadata": doc.metadata,
+                            }
+                            for doc in docs
+                        ],
+                        protocol=5,
+                    )
+                )
+            except OSError:
+                pass
 
-        # PDF에서 문서 로드 (페이지별로 분리됨)
-        docs = loader.load()
+        return docs
 
-        # RecursiveCharacterTextSplitter로 더 작은 청크로 분할
-        # 이는 LLM이 처리할 수 있는 크기로 만듦
-        return self.splitter.split_documents(docs)
+    def _cache_path(self, file_path: str) -> Path | None:
+        """(절대경로, mtime_ns, 청킹 파라미터) 키에 대응하는 캐시 파일 경로 계산
 
-    def get_text(self, file_path: str, max_chunks: int = None) -> str:
+        파일이 수정되면 mtime_ns가 바뀌어 자동으로 캐시 미스가 됩니다.
+        키 해시는 blake2b 사용 (캐시 키 용도로 충분하며 sha256보다 빠름).
+        """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+        key = (
+            f"{os.path.abspath(file_path)}:{mtime_ns}"
+            f":{self.chunk_size}:{self.chunk_overlap}"
+        )
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return _CACHE_DIR / f"{digest}.pkl"
+
+    def get_text(
+        self,
+        source: str | IO[bytes],
+        max_chunks: int = None,
+        max_tokens: int = None,
+    ) -> str:
         """
         컨텐츠를 로드하고 연결된 평문 텍스트로 반환하는 메서드
 
         Args:
-            file_path (str): 로드할 PDF 파일의 경로
+            source (str | IO[bytes]): 로드할 PDF 파일의 경로 또는 파일류 객체
             max_chunks (int, optional): 최대 사용할 청크 수.
                                         None이면 모든 청크 사용.
                                         LLM 컨텍스트 크기 제한을 위해 사용.
+            max_tokens (int, optional): 토큰 예산. 지정하면 청크 수 대신
+                                        누적 토큰 수가 예산에 도달할 때까지
+                                        청크를 수집. 청크 크기가 가변적이어도
+                                        컨텍스트 창을 정확히 채우거나 넘치지
+                                        않게 함 (max_chunks보다 우선)
 
         Returns:
             str: 모든 청크를 \n\n으로 연결한 텍스트
@@ -112,15 +489,20 @@ class ContentLoader:
             >>> loader = ContentLoader()
             >>> text = loader.get_text("document.pdf", max_chunks=10)
             >>> # 처음 10개 청크만 사용하여 텍스트 추출
+            >>> text = loader.get_text("document.pdf", max_tokens=4000)
+            >>> # 토큰 예산 4000 이내로 청크 선택
         """
-        # 문서 로드 및 청크로 분할
-        docs = self.load(file_path)
-
-        # max_chunks가 지정되면 처음 N개 청크만 사용
-        # 이는 매우 큰 문서에서 LLM 컨텍스트 크기를 초과하지 않기 위함
-        if max_chunks:
-            docs = docs[:max_chunks]
+        # 스트리밍 제너레이터에서 필요한 만큼만 청크를 소비
+        # max_chunks=N이면 N개 청크가 나오는 즉시 순회가 멈추므로
+        # 뒤쪽 페이지들은 아예 파싱되지 않음 (700페이지 문서에서 5개 청크만
+        # 필요할 때 전체 파싱 비용의 대부분을 건너뜀)
+        chunks = self.iter_chunks(source)
+        if max_tokens:
+            chunks = self._take_token_budget(chunks, max_tokens)
+        elif max_chunks:
+            chunks = islice(chunks, max_chunks)
 
-        # 모든 청크의 텍스트를 \n\n으로 연결
+        # 모든 청크의 텍스트를 \n\n으로 연결 (제너레이터 표현식:
+        # str.join이 내부에서 한 번만 순회하므로 중간 리스트 할당이 불필요)
         # 두 개의 개행은 청크 간 구분을 명확히 하기 위함
-        return "\n\n".join([doc.page_content for doc in docs])
+        return "\n\n".join(doc.page_content for doc in chunks)
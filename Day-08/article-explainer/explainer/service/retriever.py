@@ -0,0 +1,62 @@
+"""
+파일명: retriever.py
+설명: 업로드된 문서를 임베딩하여 질의별 top-k 청크를 검색하는 유틸리티
+
+SWARM 패턴에서의 역할:
+    - 업로드 시점에 문서를 한 번만 임베딩 (FAISS 인덱스 생성)
+    - 질의 시점에는 관련 청크 k개만 검색하여 프롬프트에 주입
+    - 매 턴 문서 전체를 재전송하던 것을 "관련 청크 k개"로 축소
+
+배경:
+    에이전트의 attention 비용은 프롬프트 길이에 제곱으로 비례하므로,
+    문서 QA 앱에서 프롬프트를 "문서 전체 → top-k 청크"로 줄이는 것이
+    LLM 비용/지연시간에 가장 큰 단일 레버입니다.
+"""
+
+import os
+
+from dotenv import load_dotenv
+from langchain_community.vectorstores import FAISS
+from langchain_ollama import OllamaEmbeddings
+from langchain_openai import OpenAIEmbeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+
+def _get_embeddings():
+    """임베딩 모델을 반환 (config.get_chat_model과 동일한 fallback 규칙)
+
+    OPENAI_API_KEY가 있으면 OpenAI 임베딩을, 없으면 로컬 Ollama 임베딩을 사용합니다.
+    """
+    load_dotenv()
+    if os.getenv("OPENAI_API_KEY"):
+        return OpenAIEmbeddings(model="text-embedding-3-small")
+    # 로컬 fallback: Ollama의 경량 임베딩 모델 (`ollama pull bge-m3`)
+    return OllamaEmbeddings(model="bge-m3", base_url="http://localhost:11434")
+
+
+def build_retriever(document_content: str, k: int = 3):
+    """
+    문서 텍스트를 임베딩하여 top-k 검색 retriever를 생성하는 함수
+
+    업로드당 한 번만 호출하면 되며, 이후 질의는 인덱스 검색만 수행합니다.
+    (호출부에서 문서 해시 기준으로 캐시하는 것을 권장 — 페이지의
+    @st.cache_resource 참고)
+
+    Args:
+        document_content (str): 추출된 문서 전체 텍스트
+        k (int): 질의당 반환할 청크 수. 기본값 3
+
+    Returns:
+        VectorStoreRetriever: retriever.invoke(query)로 관련 Document 리스트 반환
+
+    Example:
+        >>> retriever = build_retriever(document_content)
+        >>> chunks = retriever.invoke("what is the main contribution?")
+        >>> context = "\\n\\n".join(c.page_content for c in chunks)
+    """
+    # 약 500토큰(~2000자) 단위로 재분할하여 임베딩 단위를 맞춤
+    splitter = RecursiveCharacterTextSplitter(chunk_size=2000, chunk_overlap=200)
+    chunks = splitter.split_text(document_content)
+
+    vectorstore = FAISS.from_texts(chunks, _get_embeddings())
+    return vectorstore.as_retriever(search_kwargs={"k": k})
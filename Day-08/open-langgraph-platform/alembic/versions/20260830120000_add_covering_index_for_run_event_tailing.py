@@ -0,0 +1,38 @@
+"""Add covering index for run_events SSE tail queries
+
+SSE consumers poll `WHERE run_id = ? AND seq > ? ORDER BY seq` to tail a
+run's event stream. The existing idx_run_events_seq satisfies the B-tree
+lookup but every matching row still requires a heap fetch for `event`.
+Including `event` in the index turns the tail query into an index-only
+scan for the common case where only the event type is inspected.
+
+`data` is deliberately NOT included: JSONB payloads can exceed the
+B-tree tuple size limit (~2.7 KB) and included columns cannot be
+TOASTed, which would make inserts of large streaming events fail.
+
+Revision ID: c41f9a63d0e2
+Revises: aee821a02fc8
+Create Date: 2026-08-30 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c41f9a63d0e2"
+down_revision = "aee821a02fc8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_run_events_tail",
+        "run_events",
+        ["run_id", "seq"],
+        postgresql_include=["event"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_run_events_tail", table_name="run_events")
@@ -0,0 +1,34 @@
+"""Add composite index for assistant keyset pagination
+
+Assistant search now supports a cursor that continues from the last
+seen (created_at, assistant_id) pair instead of OFFSET, which degrades
+linearly with page depth because Postgres must scan and discard the
+skipped rows. The composite index matches the search ordering
+(user_id, created_at DESC, assistant_id DESC) so the row-value
+comparison in the cursor predicate becomes an Index Cond and each page
+fetch costs the same regardless of depth.
+
+Revision ID: 9f4c8a21d6b3
+Revises: c41f9a63d0e2
+Create Date: 2026-08-30 12:40:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9f4c8a21d6b3"
+down_revision = "c41f9a63d0e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX assistants_user_created_idx "
+        "ON assistant (user_id, created_at DESC, assistant_id DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("assistants_user_created_idx", table_name="assistant")
@@ -0,0 +1,33 @@
+"""Add GIN index for assistant metadata containment filters
+
+The metadata filter in assistant search/count uses the JSONB
+containment operator (@>), which sequential-scans the table without an
+index. A GIN index with the jsonb_path_ops opclass (smaller and faster
+than the default opclass for pure containment queries) lets the planner
+answer `metadata @> $1` in O(matching rows) instead of O(all rows) —
+the dominant cost for tenants with many assistants.
+
+Revision ID: b82df30a917c
+Revises: 9f4c8a21d6b3
+Create Date: 2026-08-30 12:50:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b82df30a917c"
+down_revision = "9f4c8a21d6b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX assistants_metadata_gin "
+        "ON assistant USING GIN (metadata jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("assistants_metadata_gin", table_name="assistant")
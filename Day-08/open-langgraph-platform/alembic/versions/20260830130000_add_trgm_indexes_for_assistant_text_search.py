@@ -0,0 +1,40 @@
+"""Add trigram indexes for assistant name/description search
+
+The name and description filters in assistant search use
+ILIKE '%term%', which no btree index can serve — every search is a
+sequential scan with a per-row pattern match. pg_trgm GIN indexes
+over lower(name) and lower(description) let the planner answer
+substring matches from the index. The search predicate was changed in
+the same commit to lower(col) LIKE lower(pattern) so it matches these
+expression indexes exactly.
+
+Revision ID: d47e19c5a8f0
+Revises: b82df30a917c
+Create Date: 2026-08-30 13:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d47e19c5a8f0"
+down_revision = "b82df30a917c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX assistants_name_trgm "
+        "ON assistant USING GIN (lower(name) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX assistants_description_trgm "
+        "ON assistant USING GIN (lower(description) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("assistants_description_trgm", table_name="assistant")
+    op.drop_index("assistants_name_trgm", table_name="assistant")
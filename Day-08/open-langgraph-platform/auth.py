@@ -52,13 +52,20 @@ elif AUTH_TYPE == "custom":
         Modify this function to integrate with your authentication service.
         """
         # Extract authorization header
-        # Headers can be either str or bytes depending on ASGI implementation
-        authorization = (
-            headers.get("authorization")
-            or headers.get("Authorization")
-            or headers.get(b"authorization")  # type: ignore[call-overload]
-            or headers.get(b"Authorization")  # type: ignore[call-overload]
-        )
+        # Headers can be either str or bytes depending on ASGI implementation.
+        # ASGI servers normalize header names to lowercase, so the two direct
+        # lookups cover the hot path; the single case-insensitive pass below
+        # handles non-conforming callers without chaining more dict hits.
+        authorization = headers.get("authorization") or headers.get(b"authorization")  # type: ignore[call-overload]
+        if authorization is None:
+            authorization = next(
+                (
+                    value
+                    for key, value in headers.items()
+                    if key.lower() in ("authorization", b"authorization")
+                ),
+                None,
+            )
 
         # Handle bytes headers (ASGI spec allows bytes)
         if isinstance(authorization, bytes):
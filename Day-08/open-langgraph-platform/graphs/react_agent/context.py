@@ -17,7 +17,7 @@
         system_prompt = runtime.context.system_prompt
 
 특징:
-- 환경 변수 자동 로드: __post_init__에서 대문자 환경 변수 확인
+- 환경 변수 자동 로드: 임포트 시 대문자 환경 변수를 1회 확인하여 기본값 결정
 - 타입 안전성: dataclass로 정의되어 IDE 자동완성 지원
 - 메타데이터: 각 필드에 설명 포함하여 문서화 및 UI 생성 지원
 """
@@ -25,11 +25,18 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field
 from typing import Annotated
 
 from react_agent import prompts
 
+# 환경 변수 기본값은 임포트 시 1회만 해석 (프로세스 수명 동안 env는 상수로 취급)
+# Context()는 그래프 실행마다 생성되므로, 필드별 factory에서 os.environ을
+# 조회하던 방식 대비 고QPS에서 인스턴스 생성이 순수 dataclass 경로가 됨
+_PROMPT_DEFAULT = os.environ.get("SYSTEM_PROMPT", prompts.SYSTEM_PROMPT)
+_MODEL_DEFAULT = os.environ.get("MODEL", "openai/gpt-4o-mini")
+_MAX_RESULTS_DEFAULT = int(os.environ.get("MAX_SEARCH_RESULTS", 10))
+
 
 @dataclass(kw_only=True)
 class Context:
@@ -61,12 +68,13 @@ class Context:
 
     참고:
         - kw_only=True로 키워드 인자만 허용
-        - __post_init__에서 환경 변수 자동 로드 수행
+        - 환경 변수 기본값은 모듈 임포트 시 1회만 해석된 모듈 상수
+          (명시적으로 전달된 인자가 항상 우선)
         - metadata는 LangGraph Studio UI에서 설정 폼 생성에 사용됨
     """
 
     system_prompt: str = field(
-        default=prompts.SYSTEM_PROMPT,
+        default=_PROMPT_DEFAULT,
         metadata={
             "description": "The system prompt to use for the agent's interactions. "
             "This prompt sets the context and behavior for the agent."
@@ -80,7 +88,7 @@ class Context:
     """
 
     model: Annotated[str, {"__template_metadata__": {"kind": "llm"}}] = field(
-        default="openai/gpt-4o-mini",
+        default=_MODEL_DEFAULT,
         metadata={
             "description": "The name of the language model to use for the agent's main interactions. "
             "Should be in the form: provider/model-name."
@@ -97,8 +105,23 @@ class Context:
     환경 변수 MODEL로 오버라이드할 수 있습니다.
     """
 
+    llm_cache: bool = field(
+        default=False,
+        metadata={
+            "description": "Enable the exact-match LLM response cache. "
+            "Only safe with deterministic sampling (temperature 0); "
+            "leave off otherwise, as cache hits replay a previous sample."
+        },
+    )
+    """정확 일치 LLM 응답 캐시 사용 여부 (opt-in)
+
+    캐시 히트는 이전 샘플을 그대로 재생하므로 temperature 0 등 결정적
+    샘플링 설정에서만 켜야 합니다. 기본값 False — 확률적 샘플링을
+    조용히 결정적으로 만드는 것을 방지합니다.
+    """
+
     max_search_results: int = field(
-        default=10,
+        default=_MAX_RESULTS_DEFAULT,
         metadata={
             "description": "The maximum number of search results to return for each search query."
         },
@@ -110,38 +133,3 @@ class Context:
 
     환경 변수 MAX_SEARCH_RESULTS로 오버라이드할 수 있습니다.
     """
-
-    def __post_init__(self) -> None:
-        """환경 변수에서 설정값 자동 로드
-
-        데이터클래스 초기화 후 실행되어, 명시적으로 전달되지 않은 필드에 대해
-        환경 변수에서 값을 로드합니다. 필드명을 대문자로 변환한 환경 변수를 확인합니다.
-
-        동작 흐름:
-        1. 모든 dataclass 필드를 순회
-        2. init=False인 필드는 건너뜀 (계산된 필드 등)
-        3. 현재 값이 기본값과 같으면 환경 변수 확인
-        4. 환경 변수가 존재하면 해당 값으로 설정, 없으면 기본값 유지
-
-        예시:
-            # 환경 변수 설정: MODEL=anthropic/claude-3-5-sonnet-20241022
-            context = Context()  # model 필드는 환경 변수에서 로드됨
-
-            # 명시적으로 전달하면 환경 변수 무시
-            context = Context(model="openai/gpt-4o-mini")
-
-        참고:
-            - 필드명을 대문자로 변환하여 환경 변수명 생성
-            - system_prompt -> SYSTEM_PROMPT
-            - max_search_results -> MAX_SEARCH_RESULTS
-        """
-        for f in fields(self):
-            # 초기화 불가능한 필드는 건너뜀 (계산된 필드, 내부 필드 등)
-            if not f.init:
-                continue
-
-            # 기본값이 그대로 사용된 경우에만 환경 변수 확인
-            if getattr(self, f.name) == f.default:
-                # 필드명을 대문자로 변환하여 환경 변수 조회
-                # 예: system_prompt -> SYSTEM_PROMPT
-                setattr(self, f.name, os.environ.get(f.name.upper(), f.default))
@@ -26,17 +26,23 @@ ReAct 패턴 동작 흐름:
 - Runtime[Context]를 통해 모델 설정 및 시스템 프롬프트 주입
 """
 
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import Literal, cast
+from typing import Any
 
-from langchain_core.messages import AIMessage
+import orjson
+from langchain_core.messages import AIMessage, ToolMessage
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph
-from langgraph.prebuilt import ToolNode
 from langgraph.runtime import Runtime
 
 from react_agent.context import Context
 from react_agent.state import InputState, State
-from react_agent.tools import TOOLS
+from react_agent.tools import TOOL_SCHEMAS, TOOLS
 from react_agent.utils import load_chat_model
 
 # ---------------------------------------------------------------------------
@@ -44,6 +50,138 @@ from react_agent.utils import load_chat_model
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
+def _get_bound_model(model_name: str):
+    """모델명별로 도구가 바인딩된 채팅 모델을 캐시하여 반환
+
+    bind_tools()에 호출 가능 객체를 넘기면 도구 시그니처를 JSON 스키마로
+    직렬화하는 비용(수백 µs~ms)이 발생하므로, 임포트 시 미리 변환해 둔
+    TOOL_SCHEMAS(dict 목록)를 그대로 전달합니다. 모델명이 같으면 바인딩된
+    인스턴스를 재사용합니다 (스키마는 모듈 상수이므로 캐시 키에 불필요).
+    """
+    return load_chat_model(model_name).bind_tools(TOOL_SCHEMAS)
+
+
+# 프롬프트 문자열 → ("{system_time}" 앞부분, 뒷부분) 분할 캐시
+# str.format은 호출할 때마다 템플릿 전체를 다시 파싱하므로, 자리표시자가
+# 하나뿐인 이 경우는 분할을 1회만 하고 이후엔 문자열 연결만 수행
+# (뒷부분이 None이면 자리표시자가 없는 프롬프트 — 그대로 사용)
+_PROMPT_SPLITS: dict[str, tuple[str, str | None]] = {}
+
+
+def _split_system_prompt(prompt: str) -> tuple[str, str | None]:
+    """시스템 프롬프트를 {system_time} 기준으로 1회만 분할하여 캐시"""
+    parts = _PROMPT_SPLITS.get(prompt)
+    if parts is None:
+        prefix, separator, suffix = prompt.partition("{system_time}")
+        parts = (prefix, suffix) if separator else (prompt, None)
+        _PROMPT_SPLITS[prompt] = parts
+    return parts
+
+
+# 최근 창 크기: 이 수의 최신 메시지는 원문 그대로 유지
+_WINDOW_SIZE = 8
+
+# 압축된 옛 도구 관찰의 최대 보존 문자 수
+_OBSERVATION_LIMIT = 200
+
+
+def _prepare_messages(messages: list) -> list:
+    """LLM 호출 전 메시지 히스토리를 압축하는 전처리 함수
+
+    append-only 히스토리를 매 턴 전부 전달하면 토큰 비용이 O(N)으로
+    증가하고 긴 세션에서 컨텍스트 창을 넘깁니다. 첫 사용자 턴(과제 정의)과
+    최근 _WINDOW_SIZE개 메시지는 원문을 유지하고, 그 사이의 오래된
+    ToolMessage 관찰은 앞부분만 남기고 잘라냅니다.
+
+    구조 보존 규칙:
+    - AIMessage(tool_calls)와 대응 ToolMessage의 짝은 깨지 않음
+      (제공자 API가 짝 불일치를 400으로 거부) — 그래서 메시지를 삭제하지
+      않고 내용만 축약하며, 최근 창 경계가 ToolMessage 중간에 걸리면
+      경계를 앞으로 당겨 짝을 포함시킴
+    """
+    if len(messages) <= _WINDOW_SIZE + 1:
+        return list(messages)
+
+    # 최근 창 경계 보정: ToolMessage로 시작하면 대응 AIMessage까지 포함
+    start = len(messages) - _WINDOW_SIZE
+    while start > 1 and isinstance(messages[start], ToolMessage):
+        start -= 1
+
+    prepared = [messages[0]]
+    for message in messages[1:start]:
+        content = message.content
+        if (
+            isinstance(message, ToolMessage)
+            and isinstance(content, str)
+            and len(content) > _OBSERVATION_LIMIT
+        ):
+            # 오래된 관찰은 앞부분만 보존 (이미 후속 추론에 반영된 정보)
+            prepared.append(
+                ToolMessage(
+                    content=content[:_OBSERVATION_LIMIT] + " …[truncated observation]",
+                    name=message.name,
+                    tool_call_id=message.tool_call_id,
+                    id=message.id,
+                )
+            )
+        else:
+            prepared.append(message)
+    prepared.extend(messages[start:])
+    return prepared
+
+
+# LLM 라운드트립 캐시 (정확 일치 티어, opt-in)
+# 같은 (시스템 메시지, 대화 히스토리) 입력이 반복되면 — 결정적 도구 흐름이나
+# 동일 질문 재요청 — 모델 호출 전체를 메모리 읽기로 대체합니다.
+# Context.llm_cache가 켜진 경우에만 동작: 히트는 이전 샘플의 재생이므로
+# temperature 0이 아닌 설정에서는 확률적 출력을 조용히 고정시켜 버립니다.
+# 임베딩 유사도 티어는 별도 의존성(fastembed/hnswlib)이 필요해 제외.
+_LLM_CACHE: OrderedDict[bytes, tuple[Any, list]] = OrderedDict()
+_LLM_CACHE_MAXSIZE = 128
+
+
+def _llm_cache_key(system_message: str, messages: list) -> bytes:
+    """(시스템 메시지, 히스토리)의 정규화 직렬화를 blake2b로 해시
+
+    tool_calls도 키에 포함 — content만 직렬화하면 도구 호출 내역만 다른
+    히스토리(예: 빈 content + tool_calls인 AIMessage)가 충돌합니다.
+    """
+    return hashlib.blake2b(
+        orjson.dumps(
+            [
+                system_message,
+                [
+                    [m.type, m.content, getattr(m, "tool_calls", None) or None]
+                    for m in messages
+                ],
+            ],
+            default=str,
+        ),
+        digest_size=16,
+    ).digest()
+
+
+# 시스템 타임스탬프 캐시 (약 1초 유효)
+# datetime.now(tz=UTC) + isoformat()은 호출마다 tz 변환과 문자열 포맷팅을
+# 수행합니다. 값 자체는 시(hour) 단위로 내림되어 한 시간 동안 동일하므로,
+# 동시 실행 중인 call_model들이 1초 단위로 재계산된 문자열을 공유합니다.
+_system_time_cache: tuple[float, str] = (0.0, "")
+
+
+def _get_system_time() -> str:
+    """시 단위로 내림한 UTC ISO 타임스탬프 반환 (1초간 캐시)"""
+    global _system_time_cache
+    cached_at, value = _system_time_cache
+    now = time.monotonic()
+    if not value or now - cached_at >= 1.0:
+        value = (
+            datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0).isoformat()
+        )
+        _system_time_cache = (now, value)
+    return value
+
+
 async def call_model(
     state: State, runtime: Runtime[Context]
 ) -> dict[str, list[AIMessage]]:
@@ -72,24 +210,63 @@ async def call_model(
         - 최대 스텝에 도달했는데 여전히 도구 호출을 시도하면 에러 메시지 반환
         - bind_tools()를 통해 LLM이 사용 가능한 도구 목록을 인지하게 함
     """
-    # 런타임 컨텍스트에서 모델 설정을 가져와 도구와 바인딩
+    # 런타임 컨텍스트를 지역 변수에 1회 바인딩 — runtime.context는 접근마다
+    # 디스크립터를 경유하므로 핫 노드 안에서는 반복 속성 체인을 피합니다
+    ctx = runtime.context
+
+    # 컨텍스트의 모델 설정을 가져와 도구와 바인딩 (모델명별 캐시 재사용)
     # 모델이 어떤 도구를 사용할 수 있는지 알려줌 (도구 스키마 주입)
-    model = load_chat_model(runtime.context.model).bind_tools(TOOLS)
+    model = _get_bound_model(ctx.model)
 
     # 시스템 프롬프트 포맷팅 - 현재 시간을 주입하여 에이전트가 시간 정보를 인지
     # 시스템 프롬프트는 에이전트의 역할과 행동 방식을 정의함
-    system_message = runtime.context.system_prompt.format(
-        system_time=datetime.now(tz=UTC).isoformat()
-    )
+    # (템플릿 파싱은 _split_system_prompt가 1회만 수행, 이후엔 연결만)
+    prefix, suffix = _split_system_prompt(ctx.system_prompt)
+    if suffix is None:
+        system_message = prefix
+    else:
+        # 타임스탬프는 시(hour) 단위로 내림: 초 단위 타임스탬프는 매 요청마다
+        # 시스템 메시지를 바꿔 제공자 측 프롬프트 캐시(Anthropic/Bedrock 등)를
+        # 무효화하므로, 정밀도를 시간 단위로 낮추면 같은 시간대의 요청들이
+        # 캐시를 공유함. 프롬프트의 큰 고정부가 앞, 가변 타임스탬프가 꼬리에
+        # 오는 현재 배치는 prefix 기반 캐시에 이미 유리한 구조.
+        # (타임스탬프 문자열 자체도 _get_system_time이 1초간 캐시)
+        system_message = f"{prefix}{_get_system_time()}{suffix}"
 
     # LLM 호출 - 시스템 메시지와 대화 히스토리를 입력으로 전달
-    # LLM은 컨텍스트를 분석하고 다음 행동(도구 호출 or 답변)을 결정
-    response = cast(
-        "AIMessage",
-        await model.ainvoke(
-            [{"role": "system", "content": system_message}, *state.messages]
-        ),
-    )
+    # ainvoke는 전체 응답이 끝날 때까지 블로킹되어 TTFT(첫 토큰까지의
+    # 시간)가 전체 생성 시간과 같아지므로, astream으로 청크를 받으면서
+    # 누적하고 부분 토큰은 custom 스트림 채널로 즉시 내보냄
+    # (stream_mode="custom" 소비자가 없으면 writer 호출은 no-op)
+    # 정확 일치 캐시 조회 (Context.llm_cache로 opt-in한 경우에만):
+    # 같은 입력이면 모델 호출 없이 즉시 반환
+    # (캐시된 content/tool_calls로 새 AIMessage를 만들어 메시지 id 충돌 방지)
+    prepared = _prepare_messages(state.messages)
+    use_llm_cache = ctx.llm_cache
+    if use_llm_cache:
+        cache_key = _llm_cache_key(system_message, prepared)
+        cached = _LLM_CACHE.get(cache_key)
+        if cached is not None:
+            _LLM_CACHE.move_to_end(cache_key)
+            content, tool_calls = cached
+            return {
+                "messages": [AIMessage(content=content, tool_calls=tool_calls)],
+                "last_tool_calls_count": len(tool_calls),
+            }
+
+    writer = get_stream_writer()
+    accumulated = None
+    async for chunk in model.astream(
+        [{"role": "system", "content": system_message}, *prepared]
+    ):
+        accumulated = chunk if accumulated is None else accumulated + chunk
+        if chunk.content:
+            writer({"llm_token": chunk.content})
+    # typing.cast는 런타임 no-op이지만 호출 프레임과 typing 의존을 남기므로
+    # 평범한 대입으로 충분 (타입은 astream 스텁이 보장)
+    # 스트림이 청크를 하나도 내지 않으면 accumulated가 None으로 남는데,
+    # 그대로 역참조하면 AttributeError가 나므로 빈 응답으로 처리
+    response: AIMessage = accumulated if accumulated is not None else AIMessage(content="")
 
     # 최대 스텝 도달 체크: 무한 루프 방지를 위한 안전 장치
     # 마지막 스텝인데도 LLM이 여전히 도구를 호출하려 하면 강제 종료
@@ -100,12 +277,72 @@ async def call_model(
                     id=response.id,
                     content="Sorry, I could not find an answer to your question in the specified number of steps.",
                 )
-            ]
+            ],
+            "last_tool_calls_count": 0,
         }
 
-    # LLM 응답을 상태에 추가하여 반환
-    # 다음 노드(route_model_output)가 이 메시지를 기반으로 라우팅 결정
-    return {"messages": [response]}
+    # 응답을 캐시에 저장 (opt-in 시에만, LRU 축출로 크기 제한)
+    if use_llm_cache:
+        _LLM_CACHE[cache_key] = (response.content, list(response.tool_calls or ()))
+        _LLM_CACHE.move_to_end(cache_key)
+        while len(_LLM_CACHE) > _LLM_CACHE_MAXSIZE:
+            _LLM_CACHE.popitem(last=False)
+
+    # LLM 응답을 상태에 추가하여 반환 (도구 호출 개수를 파생 채널에 기록 —
+    # 라우터가 메시지 객체 대신 정수 하나만 읽게 함)
+    # 다음 노드(route_model_output)가 이 값을 기반으로 라우팅 결정
+    return {
+        "messages": [response],
+        "last_tool_calls_count": len(response.tool_calls or ()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 노드 함수: 병렬 도구 실행
+# ---------------------------------------------------------------------------
+
+# 도구 이름 → 도구 함수 매핑 (tool_calls의 name으로 조회)
+_TOOLS_BY_NAME = {getattr(tool, "name", tool.__name__): tool for tool in TOOLS}
+
+
+async def _invoke_tool(tool_call: dict[str, Any]) -> ToolMessage:
+    """단일 tool_call을 실행하고 결과를 ToolMessage로 감싸는 헬퍼
+
+    예외는 해당 호출의 ToolMessage 내용으로 변환하여 LLM이 실패를 보고
+    재시도/우회를 결정할 수 있게 합니다 (한 도구의 실패가 같은 턴의 다른
+    도구 결과를 버리지 않음).
+    """
+    tool = _TOOLS_BY_NAME[tool_call["name"]]
+    try:
+        result = await tool(**tool_call["args"])
+        # 도구 결과 직렬화는 턴마다 실행되는 경로라 stdlib json 대신
+        # C 구현 orjson 사용 (2~5배 빠르고 임시 문자열 할당이 적음)
+        content = (
+            result
+            if isinstance(result, str)
+            else orjson.dumps(result, default=str).decode()
+        )
+    except Exception as exc:  # noqa: BLE001 - 도구 실패는 메시지로 전달
+        content = f"Error: {exc}"
+    return ToolMessage(
+        content=content, name=tool_call["name"], tool_call_id=tool_call["id"]
+    )
+
+
+async def execute_tools(state: State) -> dict[str, list[ToolMessage]]:
+    """마지막 AIMessage의 tool_calls를 병렬로 실행하는 노드
+
+    기본 ToolNode는 한 턴의 여러 도구 호출을 직렬로 실행해 총 지연이
+    합산되지만, 독립적인 호출들은 asyncio.gather로 동시에 실행하면 총
+    지연이 가장 느린 호출 하나로 수렴합니다 (다중 검색 턴에서 효과 큼).
+    gather는 결과를 입력 순서대로 반환하므로 ToolMessage 순서도 LLM이
+    생성한 tool_calls 순서와 일치합니다.
+    """
+    last_message: AIMessage = state.messages[-1]
+    results = await asyncio.gather(
+        *[_invoke_tool(tool_call) for tool_call in last_message.tool_calls]
+    )
+    return {"messages": list(results)}
 
 
 # ---------------------------------------------------------------------------
@@ -122,10 +359,9 @@ builder = StateGraph(State, input_schema=InputState, context_schema=Context)
 # LLM이 대화 컨텍스트를 분석하고 다음 행동(도구 호출 or 답변) 결정
 builder.add_node(call_model)
 
-# 노드 2: tools - 도구 실행 노드 (LangGraph의 ToolNode 활용)
-# LLM이 선택한 도구를 실제로 실행하고 결과를 상태에 추가
-# ToolNode는 tool_calls를 자동으로 파싱하여 해당 도구를 호출함
-builder.add_node("tools", ToolNode(TOOLS))
+# 노드 2: tools - 도구 실행 노드 (병렬 디스패치)
+# LLM이 선택한 도구들을 asyncio.gather로 동시에 실행하고 결과를 상태에 추가
+builder.add_node("tools", execute_tools)
 
 # ---------------------------------------------------------------------------
 # 엣지 정의: 그래프의 실행 흐름 구성
@@ -136,60 +372,36 @@ builder.add_node("tools", ToolNode(TOOLS))
 builder.add_edge("__start__", "call_model")
 
 
-def route_model_output(state: State) -> Literal["__end__", "tools"]:
-    """LLM 출력을 기반으로 다음 노드 결정 - ReAct 패턴의 조건부 라우팅
+def _compile_route_model_output():
+    """조건부 라우팅 함수를 런타임 코드 생성으로 특수화하여 반환
 
-    이 함수는 ReAct 패턴의 핵심 분기 로직을 담당합니다.
-    LLM의 마지막 응답을 확인하여 도구 호출이 필요한지(Action) 또는 최종 답변인지(End) 판단합니다.
-
-    라우팅 로직:
-    - 도구 호출 있음 → "tools" 노드로 이동 (도구 실행)
-    - 도구 호출 없음 → "__end__" 노드로 이동 (그래프 종료)
-
-    Args:
-        state (State): 현재 대화 상태 (메시지 히스토리 포함)
+    라우팅 로직 자체는 단순합니다: 마지막 응답의 도구 호출 개수
+    (call_model이 기록한 파생 스칼라)가 0보다 크면 "tools"로, 아니면
+    "__end__"로 분기 (ReAct의 Action/종료 결정).
+    이 함수는 매 턴 호출되는 초핫패스이므로, exec 기반 코드 생성으로
+    전역 이름("__end__"/"tools" 상수)을 기본 인자로 바인딩해
+    LOAD_GLOBAL 없이 LOAD_FAST만 수행하는 전용 클로저를 만듭니다.
+    (rung 6 특수화 — 긴 ReAct 루프에서 엣지 순회당 오버헤드 최소화)
 
     Returns:
-        Literal["__end__", "tools"]: 다음에 실행할 노드 이름
-            - "__end__": 그래프 종료 (최종 답변 완료)
-            - "tools": 도구 실행 노드로 이동
-
-    Raises:
-        ValueError: 마지막 메시지가 AIMessage가 아닌 경우
-            (그래프 구조상 call_model 다음은 항상 AIMessage여야 함)
-
-    참고:
-        - ReAct 패턴의 "Thought → Action → Observation" 사이클을 구현
-        - 도구 호출이 있으면 tools 노드에서 실행 후 다시 call_model로 복귀
-        - 도구 호출이 없으면 LLM이 최종 답변을 완성했다고 판단하여 종료
+        Callable: state를 받아 "tools" 또는 "__end__"를 반환하는 함수
     """
-    # 상태에서 가장 최근 메시지(LLM 응답) 추출
-    last_message = state.messages[-1]
-
-    # 타입 안전성 검증: call_model 노드 다음은 항상 AIMessage여야 함
-    if not isinstance(last_message, AIMessage):
-        raise ValueError(
-            f"Expected AIMessage in output edges, but got {type(last_message).__name__}"
-        )
-
-    # 도구 호출이 없으면 그래프 종료
-    # LLM이 최종 답변을 텍스트로만 반환했다는 의미 (더 이상 도구 실행 불필요)
-    if not last_message.tool_calls:
-        return "__end__"
-
-    # 도구 호출이 있으면 tools 노드로 이동하여 실행
-    # ReAct 패턴의 "Action" 단계 진입
-    return "tools"
+    source = (
+        'def route_model_output(state, _TOOLS="tools", _END="__end__"):\n'
+        "    return _TOOLS if state.last_tool_calls_count else _END\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<route_model_output>", "exec"), namespace)  # noqa: S102
+    return namespace["route_model_output"]
 
 
 # call_model → (조건부 분기) → __end__ or tools
-# call_model 노드 실행 후 route_model_output 함수로 다음 노드를 동적으로 결정
-# ReAct 패턴의 핵심: LLM 응답에 따라 도구 실행 or 종료를 선택
+# call_model 완료 후 특수화된 라우팅 함수로 다음 노드를 동적으로 결정
+# (코드 생성 함수에는 반환 타입 어노테이션이 없으므로 분기 목록을 명시)
 builder.add_conditional_edges(
     "call_model",
-    # call_model 완료 후 route_model_output 함수 실행하여 다음 노드 결정
-    # 반환값에 따라 "__end__" 또는 "tools" 노드로 분기
-    route_model_output,
+    _compile_route_model_output(),
+    ["tools", "__end__"],
 )
 
 # tools → call_model (고정 엣지)
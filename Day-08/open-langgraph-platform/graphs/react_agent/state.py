@@ -11,6 +11,10 @@ TypedDict를 사용하여 상태 채널과 리듀서를 명확히 정의하고,
 상태 채널:
 • messages - 대화 메시지 이력 (add_messages 리듀서로 관리)
 • is_last_step - 재귀 제한 도달 여부를 나타내는 관리형 변수
+
+참고:
+    상태 객체는 매 턴 생성/직렬화되므로 slots=True로 정의하여
+    인스턴스당 __dict__ 할당을 없애고 속성 접근을 빠르게 합니다.
 """
 
 from __future__ import annotations
@@ -24,7 +28,7 @@ from langgraph.graph import add_messages
 from langgraph.managed import IsLastStep
 
 
-@dataclass
+@dataclass(slots=True)
 class InputState:
     """에이전트의 입력 상태를 정의하며, 외부 세계와의 좁은 인터페이스를 나타냄
 
@@ -64,7 +68,7 @@ class InputState:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class State(InputState):
     """에이전트의 완전한 상태를 나타내며, InputState를 추가 속성으로 확장
 
@@ -90,6 +94,15 @@ class State(InputState):
             return {"messages": [AIMessage(content="응답")]}
     """
 
+    last_tool_calls_count: int = field(default=0)
+    """마지막 AIMessage가 포함한 tool_calls 개수 (파생 스칼라 채널)
+
+    라우팅은 "마지막 응답에 도구 호출이 있는가"만 필요하므로,
+    call_model이 응답을 추가할 때 개수를 함께 기록해 두면 조건부 엣지가
+    매 턴 messages[-1] 객체 접근 + 속성 조회 대신 정수 하나만 읽습니다.
+    (메시지 채널과 같은 업데이트에서 함께 갱신되어 항상 일관됨)
+    """
+
     is_last_step: IsLastStep = field(default=False)
     """
     그래프가 오류를 발생시키기 전 현재 단계가 마지막인지 여부를 나타냄
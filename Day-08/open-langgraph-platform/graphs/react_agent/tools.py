@@ -19,12 +19,123 @@ LangGraph의 도구 호출(tool calling) 패턴과 함께 사용되어 에이전
     model = ChatOpenAI(model="gpt-4").bind_tools(TOOLS)
 """
 
+import asyncio
+import functools
+import hashlib
+import os
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
+import orjson
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.runtime import get_runtime
 
 from react_agent.context import Context
+from react_agent.utils import get_shared_http_client
+
+
+def cache_tool(maxsize: int = 256, ttl: float = 300.0):
+    """(도구 이름, 인자) 키로 도구 결과를 단기 캐싱하는 데코레이터
+
+    ReAct 루프는 같은 도구 호출(예: 동일 쿼리 검색)을 한 세션 안에서
+    반복 발행하는 일이 잦아, 캐시 히트 시 도구 지연 전체를 절약합니다.
+    키는 인자의 정렬된 JSON 직렬화를 blake2b로 해시하여 만들고,
+    같은 키의 동시 호출은 키별 asyncio.Lock으로 합쳐 한 번만 실행합니다.
+    히트/미스 카운터는 wrapper.cache_hits / wrapper.cache_misses로 노출.
+
+    Args:
+        maxsize (int): LRU 최대 엔트리 수. 기본값 256
+        ttl (float): 엔트리 유효 시간(초). 기본값 300 (검색 결과의 신선도 유지)
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        locks: dict[bytes, asyncio.Lock] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # 캐시 키 직렬화도 호출마다 수행되므로 orjson 사용
+            key = hashlib.blake2b(
+                orjson.dumps(
+                    [args, kwargs], option=orjson.OPT_SORT_KEYS, default=str
+                ),
+                digest_size=16,
+            ).digest()
+
+            entry = cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                cache.move_to_end(key)
+                wrapper.cache_hits += 1
+                return entry[1]
+
+            # 같은 키의 in-flight 호출 합치기 (thundering herd 방지)
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = cache.get(key)
+                if entry is not None and time.monotonic() - entry[0] < ttl:
+                    wrapper.cache_hits += 1
+                    return entry[1]
+
+                wrapper.cache_misses += 1
+                result = await func(*args, **kwargs)
+                cache[key] = (time.monotonic(), result)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            locks.pop(key, None)
+            return result
+
+        wrapper.cache_hits = 0
+        wrapper.cache_misses = 0
+        return wrapper
+
+    return decorator
+
+# 제공자 SDK와 공유하는 프로세스 전역 비동기 HTTP 클라이언트
+# (utils.get_shared_http_client — HTTP/2 + keep-alive 커넥션 풀)
+# 동기 클라이언트를 쓰면 LangGraph ASGI 이벤트 루프 전체가 블로킹됨.
+_HTTP = get_shared_http_client()
+
+
+@cache_tool(maxsize=256, ttl=300)
+async def _cached_search(query: str, max_search_results: int) -> dict[str, Any] | None:
+    """검색 실행 본체 (캐시 적용 지점)
+
+    결과에 영향을 주는 max_search_results를 명시적 인자로 받아 캐시 키에
+    포함시킵니다 — 런타임 컨텍스트를 이 본체 안에서 읽으면 설정이 다른
+    호출자가 먼저 채운 캐시 항목을 그대로 돌려받게 됩니다.
+
+    Args:
+        query (str): 검색할 질의어
+        max_search_results (int): 최대 검색 결과 개수 (캐시 키에 포함)
+
+    Returns:
+        dict[str, Any] | None: 검색 결과 딕셔너리
+    """
+    # API 키가 설정된 경우: 실제 Tavily 검색 (비동기 클라이언트로 논블로킹)
+    # 동기 HTTP 호출은 이벤트 루프를 멈춰 동시 실행 중인 다른 그래프까지
+    # 지연시키므로, 블로킹 라이브러리를 써야 한다면 asyncio.to_thread로 감쌀 것
+    api_key = os.getenv("TAVILY_API_KEY")
+    if api_key:
+        response = await _HTTP.post(
+            "https://api.tavily.com/search",
+            json={
+                "api_key": api_key,
+                "query": query,
+                "max_results": max_search_results,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    # 검색 결과 딕셔너리 생성 (시뮬레이션)
+    return {
+        "query": query,
+        "max_search_results": max_search_results,
+        "results": f"Simulated search results for '{query}'",
+    }
 
 
 async def search(query: str) -> dict[str, Any] | None:
@@ -37,7 +148,7 @@ async def search(query: str) -> dict[str, Any] | None:
     동작 흐름:
     1. LangGraph Runtime에서 Context 추출
     2. Context에서 max_search_results 설정 값 가져오기
-    3. 검색 쿼리와 설정을 포함한 결과 딕셔너리 반환
+    3. 캐시가 적용된 검색 본체(_cached_search)에 위임
 
     Args:
         query (str): 검색할 질의어 또는 키워드
@@ -57,15 +168,10 @@ async def search(query: str) -> dict[str, Any] | None:
         results = await search("LangGraph 최신 기능")
         print(results["results"])
     """
-    # LangGraph Runtime에서 사용자 컨텍스트 가져오기
-    runtime = get_runtime(Context)
-
-    # 검색 결과 딕셔너리 생성 (시뮬레이션)
-    return {
-        "query": query,
-        "max_search_results": runtime.context.max_search_results,
-        "results": f"Simulated search results for '{query}'",
-    }
+    # LangGraph Runtime에서 사용자 컨텍스트 가져오기 — 캐시된 본체 밖에서
+    # 읽어 명시적 인자로 전달 (설정값이 캐시 키의 일부가 되도록)
+    max_search_results = get_runtime(Context).context.max_search_results
+    return await _cached_search(query, max_search_results)
 
 
 # ---------------------------------------------------------------------------
@@ -75,3 +181,9 @@ async def search(query: str) -> dict[str, Any] | None:
 # 에이전트가 사용할 수 있는 모든 도구 함수들의 리스트
 # LangGraph에서 model.bind_tools(TOOLS)로 LLM에 바인딩됩니다
 TOOLS: list[Callable[..., Any]] = [search]
+
+# 도구 스키마를 임포트 시 1회만 직렬화한 목록
+# bind_tools에 호출 가능 객체를 넘기면 매 바인딩마다 시그니처 →
+# pydantic → JSON 스키마 변환을 반복하므로, 미리 변환한 dict를 넘겨
+# 바인딩을 순수 리스트 전달로 만듭니다 (rung 6: 임포트 시 특수화)
+TOOL_SCHEMAS: list[dict[str, Any]] = [convert_to_openai_tool(tool) for tool in TOOLS]
@@ -17,10 +17,29 @@
     model = load_chat_model("openai/gpt-4")
 """
 
+import functools
+
+import httpx
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 
+# 프로세스 전역 공유 비동기 HTTP 클라이언트
+# 제공자 SDK와 도구가 각자 AsyncClient를 만들면 TCP/TLS 풀이 클라이언트
+# 수만큼 늘어나 첫 호출 지연과 메모리를 낭비합니다. 하나를 공유하면
+# keep-alive 커넥션이 재사용되고, HTTP/2 멀티플렉싱으로 병렬 도구 호출이
+# 단일 커넥션 위에서도 동시에 진행됩니다.
+_SHARED_HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(30),
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """모듈 전역 공유 httpx.AsyncClient 반환 (도구/서빙 코드 공용)"""
+    return _SHARED_HTTP
+
 
 def get_message_text(msg: BaseMessage) -> str:
     """LangChain 메시지 객체에서 텍스트 콘텐츠 추출
@@ -62,10 +81,14 @@ def get_message_text(msg: BaseMessage) -> str:
         return content.get("text", "")
     else:
         # 복합 콘텐츠 (리스트 등): 각 부분을 텍스트로 변환 후 결합
-        txts = [c if isinstance(c, str) else (c.get("text") or "") for c in content]
-        return "".join(txts).strip()
+        # 제너레이터 표현식으로 중간 리스트 할당 제거, type is 비교는
+        # isinstance보다 빠름 (content 요소는 서브클래스가 아닌 str/dict)
+        return "".join(
+            c if type(c) is str else (c.get("text") or "") for c in content
+        ).strip()
 
 
+@functools.lru_cache(maxsize=16)
 def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     """제공자와 모델명을 포함한 전체 이름으로 채팅 모델 초기화
 
@@ -101,7 +124,20 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
 
         >>> # Runtime Context와 함께 사용
         >>> model = load_chat_model(runtime.context.model)
+
+    참고:
+        - @functools.lru_cache로 메모이즈: init_chat_model은 제공자 SDK
+          임포트(~100ms)와 자격 증명 파싱을 수반하므로 같은 이름에 대해
+          1회만 수행. BaseChatModel 인스턴스는 ainvoke에 대해 스레드
+          안전하므로 공유해도 무방
     """
     # "provider/model" 형식을 파싱 (최대 1번만 분할)
     provider, model = fully_specified_name.split("/", maxsplit=1)
-    return init_chat_model(model, model_provider=provider)
+    try:
+        # OpenAI/Anthropic 계열은 비동기 HTTP 클라이언트 주입을 지원 —
+        # 공유 커넥션 풀을 쓰면 제공자 첫 호출의 TCP/TLS 셋업이 사라짐
+        return init_chat_model(
+            model, model_provider=provider, http_async_client=_SHARED_HTTP
+        )
+    except Exception:  # noqa: BLE001 - 클라이언트 주입 미지원 제공자 fallback
+        return init_chat_model(model, model_provider=provider)
@@ -23,9 +23,13 @@ LangGraph의 interrupt() 기능을 사용하여 도구 호출 시점에 실행
 도구 호출 지원이 있는 채팅 모델과 함께 작동합니다.
 """
 
+import functools
+import hashlib
 import json
+import time
 from datetime import UTC, datetime
-from typing import Literal, cast
+from types import MappingProxyType
+from typing import Literal
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langgraph.graph import END, StateGraph
@@ -36,16 +40,85 @@ from langgraph.types import Command, interrupt
 from react_agent_hitl.context import Context
 from react_agent_hitl.state import InputState, State
 from react_agent_hitl.tools import TOOLS
-from react_agent_hitl.utils import load_chat_model
+from react_agent_hitl.utils import llm_batcher, load_chat_model
+
+@functools.lru_cache(maxsize=8)
+def _get_bound_model(model_name: str):
+    """도구가 바인딩된 모델을 모델명별로 1회만 구성
+
+    bind_tools는 도구 시그니처 인트로스펙션으로 Pydantic/JSON 스키마를
+    매번 다시 생성하므로, TOOLS가 모듈 전역으로 고정된 이상 모델명별로
+    바인딩 결과를 캐시합니다. 같은 인스턴스를 공유하면 마이크로 배처의
+    id(model) 키도 호출 간에 안정되어 배칭이 실제로 병합됩니다.
+    """
+    return load_chat_model(model_name).bind_tools(TOOLS)
+
+
+# 상태 업데이트가 없는 라우팅 명령은 불변이므로 모듈 수준 싱글턴으로
+# 재사용 — 흔한 승인/종료 경로에서 인터럽트 왕복마다의 Command 할당과
+# 검증을 제거합니다 (update가 있는 분기는 여전히 호출마다 생성)
+_CMD_END = Command(goto=END)
+_CMD_TOOLS = Command(goto="tools")
+
+# 단계 제한 도달 시 반환할 메시지 (호출마다 리터럴 재할당 방지)
+_STEP_LIMIT_MSG = (
+    "Sorry, I could not find an answer to your question "
+    "in the specified number of steps."
+)
+
+# JSON 파서: 설치되어 있으면 orjson(Rust 기반, 작은 페이로드에서 stdlib보다
+# 수 배 빠름)을 쓰고, 없으면 stdlib json으로 폴백
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # pragma: no cover - orjson은 기본 의존성
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
 
 # ---------------------------------------------------------------------------
 # 모델 호출 함수
 # ---------------------------------------------------------------------------
 
 
-async def call_model(
-    state: State, runtime: Runtime[Context]
-) -> dict[str, list[AIMessage]]:
+# 현재 초의 ISO 타임스탬프 캐시
+# (epoch_sec, iso_str) 튜플 교체는 GIL 아래에서 원자적이므로 락 불필요.
+# datetime 객체 할당과 ISO 포맷팅이 QPS와 무관하게 초당 1회로 제한됩니다.
+_iso_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso(epoch_sec: int) -> str:
+    """초 단위 epoch에 대한 ISO 문자열 반환 (초당 1회만 생성)"""
+    global _iso_cache
+    if epoch_sec != _iso_cache[0]:
+        _iso_cache = (
+            epoch_sec,
+            datetime.fromtimestamp(epoch_sec, tz=UTC).isoformat(),
+        )
+    return _iso_cache[1]
+
+
+@functools.lru_cache(maxsize=4)
+def _format_system_prompt(template: str, now_epoch: int) -> str:
+    """시스템 프롬프트를 초 단위 시각으로 포맷한 결과를 캐시
+
+    str.format은 호출마다 포맷 문자열을 다시 파싱하고, 타임스탬프도
+    매번 새 datetime 객체와 ISO 문자열을 할당합니다. 초 단위로 내림한
+    epoch을 키에 포함하면 같은 초에 들어온 호출들이 포맷 결과 문자열
+    하나를 공유합니다 (초 미만 정밀도는 LLM에 의미가 없음).
+
+    Args:
+        template (str): {system_time} 자리를 포함한 프롬프트 템플릿
+        now_epoch (int): 초 단위로 내림한 현재 epoch 시각
+
+    Returns:
+        str: 포맷 완료된 시스템 프롬프트
+    """
+    return template.format(system_time=_now_iso(now_epoch))
+
+
+async def call_model(state: State, runtime: Runtime[Context]) -> dict:
     """에이전트를 구동하는 LLM을 호출하여 다음 액션 결정
 
     이 함수는 대화 상태를 기반으로 언어 모델을 호출하고 응답을 처리합니다.
@@ -70,38 +143,41 @@ async def call_model(
         - 모델 또는 도구를 변경하려면 TOOLS 목록을 수정하세요
         - 에이전트 동작을 변경하려면 system_prompt를 커스터마이즈하세요
     """
-    # 도구 바인딩과 함께 모델 초기화
-    # 다른 모델을 사용하거나 도구를 추가하려면 여기를 수정하세요
-    model = load_chat_model(runtime.context.model).bind_tools(TOOLS)
+    # 도구 바인딩과 함께 모델 초기화 (모델명별 캐시 재사용)
+    # 다른 모델을 사용하거나 도구를 추가하려면 _get_bound_model/TOOLS를 수정하세요
+    model = _get_bound_model(runtime.context.model)
 
-    # 시스템 프롬프트 포맷팅
+    # 시스템 프롬프트 포맷팅 (같은 초의 호출들은 캐시된 결과 공유)
     # 에이전트의 행동을 변경하려면 이 부분을 커스터마이즈하세요
-    system_message = runtime.context.system_prompt.format(
-        system_time=datetime.now(tz=UTC).isoformat()
+    system_message = _format_system_prompt(
+        runtime.context.system_prompt, int(time.time())
     )
 
-    # 모델 응답 가져오기
-    response = cast(
-        "AIMessage",
-        await model.ainvoke(
-            [{"role": "system", "content": system_message}, *state.messages]
-        ),
+    # 모델 응답 가져오기 — 직접 ainvoke 대신 마이크로 배처를 경유해
+    # 같은 창(5ms) 안의 동시 호출들이 하나의 abatch 요청을 공유하게 함
+    # (cast는 런타임 no-op이므로 타입 주석으로 대체)
+    response: AIMessage = await llm_batcher.submit(
+        model, [{"role": "system", "content": system_message}, *state.messages]
     )
 
+    # 도구 호출 목록을 지역 변수에 1회 바인딩 (이후 분기에서 재사용)
+    tool_calls = response.tool_calls
+
     # 최대 단계에 도달했지만 모델이 여전히 도구를 사용하려는 경우 처리
     # 무한 루프를 방지하기 위해 에러 메시지를 반환합니다
-    if state.is_last_step and response.tool_calls:
+    if tool_calls and state.is_last_step:
         return {
-            "messages": [
-                AIMessage(
-                    id=response.id,
-                    content="Sorry, I could not find an answer to your question in the specified number of steps.",
-                )
-            ]
+            "messages": [AIMessage(id=response.id, content=_STEP_LIMIT_MSG)],
+            "pending_tool_msg_id": None,
         }
 
     # 모델의 응답을 기존 메시지에 추가될 리스트로 반환
-    return {"messages": [response]}
+    # (도구 호출이 있으면 메시지 id를 사이드 채널에 기록해 human_approval이
+    # 히스토리 전체를 스캔하지 않고 바로 찾을 수 있게 함)
+    return {
+        "messages": [response],
+        "pending_tool_msg_id": response.id if tool_calls else None,
+    }
 
 
 def _find_tool_message(messages: list) -> AIMessage | None:
@@ -117,33 +193,18 @@ def _find_tool_message(messages: list) -> AIMessage | None:
     Returns:
         AIMessage | None: 도구 호출이 있는 AI 메시지, 없으면 None
     """
-    for msg in reversed(messages):
-        if isinstance(msg, AIMessage) and hasattr(msg, "tool_calls") and msg.tool_calls:
+    # reversed()의 이터레이터 프로토콜(__next__ 디스패치) 대신 인덱스
+    # 하강 루프를 사용하고, 클래스 참조를 지역 변수로 바인딩해 반복마다의
+    # 전역 조회를 제거합니다. AIMessage의 tool_calls는 항상 존재하는
+    # 속성이므로 hasattr 검사도 불필요합니다.
+    AIM = AIMessage
+    for i in range(len(messages) - 1, -1, -1):
+        msg = messages[i]
+        if isinstance(msg, AIM) and msg.tool_calls:
             return msg
     return None
 
 
-def _create_tool_cancellations(tool_calls: list, reason: str) -> list[ToolMessage]:
-    """도구 호출에 대한 취소 메시지 생성
-
-    사용자가 도구 실행을 거부하거나 다른 액션을 선택했을 때,
-    각 도구 호출에 대한 ToolMessage를 생성하여 취소 사유를 전달합니다.
-
-    Args:
-        tool_calls (list): 취소할 도구 호출 목록 (각 항목에 id, name 포함)
-        reason (str): 취소 사유 (예: "cancelled by human operator", "invalid format")
-
-    Returns:
-        list[ToolMessage]: 각 도구 호출에 대한 취소 메시지 목록
-    """
-    return [
-        ToolMessage(
-            content=f"Tool execution {reason}.", tool_call_id=tc["id"], name=tc["name"]
-        )
-        for tc in tool_calls
-    ]
-
-
 def _parse_args(args) -> dict:
     """도구 인자 파싱 (JSON 문자열 처리 포함)
 
@@ -156,12 +217,14 @@ def _parse_args(args) -> dict:
     Returns:
         dict: 파싱된 인자 딕셔너리, 실패 시 빈 딕셔너리
     """
-    if isinstance(args, str):
-        try:
-            return json.loads(args)
-        except json.JSONDecodeError:
-            return {}
-    return args if isinstance(args, dict) else {}
+    # type() is 비교는 서브클래스 의미가 필요 없을 때 isinstance보다 빠르고,
+    # EAFP로 타입 사다리를 제거 (문자열이 아니면 파서가 TypeError를 던짐)
+    if type(args) is dict:
+        return args
+    try:
+        return _json_loads(args)
+    except (_JSONDecodeError, TypeError):
+        return {}
 
 
 def _update_tool_calls(original_calls: list, edited_args: dict) -> list:
@@ -178,22 +241,145 @@ def _update_tool_calls(original_calls: list, edited_args: dict) -> list:
     Returns:
         list: 업데이트된 도구 호출 목록
     """
+    # 수정 인자 맵은 루프 밖에서 1회만 조회
+    edits = edited_args.get("args", {})
     updated_calls = []
     for call in original_calls:
         updated_call = call.copy()
-        tool_name = call["name"]
 
         # 사용자가 이 도구에 대한 수정 인자를 제공했는지 확인
-        if tool_name in edited_args.get("args", {}):
-            updated_call["args"] = _parse_args(edited_args["args"][tool_name])
+        if call["name"] in edits:
+            updated_call["args"] = _parse_args(edits[call["name"]])
         else:
-            # 수정 인자가 없으면 원본 인자 사용
-            updated_call["args"] = _parse_args(call["args"])
+            # 수정 인자가 없으면 원본 인자 사용 — LangChain이 넘겨주는
+            # 인자는 대부분 이미 dict이므로 파서 호출 없이 그대로 사용
+            args = call["args"]
+            updated_call["args"] = args if type(args) is dict else _parse_args(args)
 
         updated_calls.append(updated_call)
     return updated_calls
 
 
+# ---------------------------------------------------------------------------
+# 도구 실행 노드 (결과 캐시 포함)
+# ---------------------------------------------------------------------------
+
+# 도구 실행 결과 캐시 (트래젝터리 캐시)
+# 같은 (도구 이름, 정규화된 인자) 호출은 개발/리플레이 중 반복 실행되는
+# 일이 잦습니다 — 특히 인터럽트에서 재개할 때 동일한 도구 호출 접두사가
+# 다시 나타납니다. 멱등한 도구만 캐시 대상으로 표시하고, 히트 시
+# ToolNode 호출 없이 저장된 결과로 ToolMessage를 만들어 반환합니다.
+# tools._SEARCH_CACHE와 같은 TTL/상한을 적용: TTL 없이는 장수 서버에서
+# 무한히 자라고, 하위 검색 캐시의 300초 신선도 보장도 무력화됩니다.
+_TOOL_RESULT_CACHE: dict[str, tuple[float, str]] = {}
+_TOOL_RESULT_CACHE_TTL = 300.0  # 초 — 검색 캐시의 신선도 창과 동일
+_TOOL_RESULT_CACHE_MAXSIZE = 1024
+_MEMOIZABLE_TOOLS = frozenset({"search"})
+
+# 인터럽트 페이로드의 불변 config 부분 — 재개 시 노드가 처음부터 다시
+# 실행되므로 interrupt() 이전의 모든 할당은 재개 사이클마다 반복됩니다.
+# 변하지 않는 부분은 모듈 수준에서 1회만 만들고 읽기 전용 뷰로 공유합니다.
+_INTERRUPT_CONFIG = MappingProxyType(
+    {
+        "allow_respond": True,  # 사용자가 직접 응답 가능
+        "allow_accept": True,  # 도구 승인 가능
+        "allow_edit": True,  # 도구 인자 수정 가능
+        "allow_ignore": True,  # 도구 실행 거부 가능
+    }
+)
+
+# 실제 도구 실행은 LangGraph 기본 ToolNode에 위임
+_tool_node = ToolNode(TOOLS)
+
+
+def _tool_cache_key(name: str, args: dict) -> str:
+    """(도구 이름 + 정렬 JSON 인자)의 sha256 캐시 키"""
+    return hashlib.sha256(
+        (name + json.dumps(args, sort_keys=True)).encode()
+    ).hexdigest()
+
+
+async def cached_tool_node(state: State) -> dict:
+    """캐시를 먼저 조회한 뒤 미스만 ToolNode로 실행하는 도구 노드
+
+    마지막 AI 메시지의 각 도구 호출에 대해:
+    1. 멱등 도구(_MEMOIZABLE_TOOLS)면 캐시 키를 계산해 조회
+    2. 히트 — 저장된 결과 문자열로 ToolMessage를 즉시 생성 (실행 생략)
+    3. 미스 — ToolNode에 위임해 실행하고 결과를 캐시에 저장
+
+    캐시 히트는 LLM 토큰도 도구의 네트워크 왕복도 소비하지 않으므로,
+    같은 접두사를 재실행하는 리플레이/재개 시나리오에서 도구 지연이
+    메모리 조회 비용으로 줄어듭니다.
+
+    human_approval이 대기열(deferred_user_messages)에 보관해 둔 사용자
+    텍스트가 있으면 모든 도구 결과 뒤에 덧붙이고 대기열을 비웁니다.
+
+    Args:
+        state (State): 현재 대화 상태 (마지막 메시지에 tool_calls 포함)
+
+    Returns:
+        dict: {"messages": [ToolMessage, ...]} 형태의 상태 업데이트
+    """
+    # 마지막 AIMessage의 도구 호출 중 아직 ToolMessage 응답이 없는 것만
+    # 실행 대상으로 삼습니다 (호출별 승인에서 일부가 취소된 경우, 취소
+    # ToolMessage가 이미 붙어 있는 호출은 건너뜀)
+    messages = state.messages
+    answered: set[str] = set()
+    ai_message = None
+    for i in range(len(messages) - 1, -1, -1):
+        m = messages[i]
+        if isinstance(m, ToolMessage):
+            answered.add(m.tool_call_id)
+        elif isinstance(m, AIMessage) and m.tool_calls:
+            ai_message = m
+            break
+
+    tool_calls = [
+        tc for tc in (ai_message.tool_calls if ai_message else []) if tc["id"] not in answered
+    ]
+    hits: list[ToolMessage] = []
+    misses = []
+    miss_keys: dict[str, str] = {}
+
+    for tc in tool_calls:
+        name = tc["name"]
+        if name in _MEMOIZABLE_TOOLS:
+            key = _tool_cache_key(name, tc.get("args", {}))
+            entry = _TOOL_RESULT_CACHE.get(key)
+            if entry is not None and time.monotonic() - entry[0] < _TOOL_RESULT_CACHE_TTL:
+                hits.append(
+                    ToolMessage(content=entry[1], name=name, tool_call_id=tc["id"])
+                )
+                continue
+            miss_keys[tc["id"]] = key
+        misses.append(tc)
+
+    # 호출별 승인에서 넘어온 사용자 텍스트는 모든 도구 결과 뒤에 붙여
+    # AIMessage(tool_calls) 바로 뒤에 ToolMessage들이 연속하도록 유지
+    deferred = state.deferred_user_messages
+
+    if not misses:
+        return {"messages": hits + deferred, "deferred_user_messages": []}
+
+    # 미스만 담은 AIMessage로 ToolNode 호출 (히트는 재실행하지 않음)
+    result = await _tool_node.ainvoke(
+        {"messages": [AIMessage(content="", tool_calls=misses)]}
+    )
+    tool_messages = result["messages"]
+
+    # 멱등 도구의 결과를 캐시에 저장
+    # (상한 도달 시 전체 비움 — 엔트리가 작고 재실행 비용은 하위 검색
+    #  캐시가 흡수하므로 LRU 추적보다 단순한 쪽을 택함)
+    for tm in tool_messages:
+        key = miss_keys.get(tm.tool_call_id)
+        if key is not None and isinstance(tm.content, str):
+            if len(_TOOL_RESULT_CACHE) >= _TOOL_RESULT_CACHE_MAXSIZE:
+                _TOOL_RESULT_CACHE.clear()
+            _TOOL_RESULT_CACHE[key] = (time.monotonic(), tm.content)
+
+    return {"messages": hits + tool_messages + deferred, "deferred_user_messages": []}
+
+
 async def human_approval(state: State) -> Command:
     """도구 실행 전 사용자 승인 요청 (핵심 인터럽트 지점)
 
@@ -234,82 +420,143 @@ async def human_approval(state: State) -> Command:
     # GitHub 이슈: https://github.com/langchain-ai/langgraph/issues/5572
     # goto=END 명령이 무시되고 "branch:to:__end__" 채널 에러 발생
 
-    # 도구 호출이 포함된 가장 최근 AI 메시지 찾기
-    tool_message = _find_tool_message(state.messages)
+    # 승인 대상 메시지 찾기: call_model이 기록한 id가 있으면 그 id로
+    # 즉시 찾고 (보통 마지막 메시지라 한 번에 적중), 구버전 체크포인트처럼
+    # id가 없는 경우에만 기존 역순 스캔으로 폴백
+    pending_id = state.pending_tool_msg_id
+    if pending_id is not None:
+        tool_message = next(
+            (m for m in reversed(state.messages) if m.id == pending_id), None
+        )
+    else:
+        tool_message = _find_tool_message(state.messages)
     if not tool_message:
         # 도구 호출이 없으면 종료
-        return Command(goto=END)
+        return _CMD_END
+
+    # 도구 호출 목록을 지역 변수에 1회 바인딩하고, 인터럽트 페이로드용
+    # 인자 맵과 호출별 요청 목록을 단일 패스로 구성합니다. 호출별 요청에는
+    # tool_call_id가 포함되어 UI가 각 호출을 독립적으로 승인/수정/거부하고
+    # 같은 순서의 응답 리스트 하나로 되돌려 줄 수 있습니다 (왕복 1회 유지).
+    tcs = tool_message.tool_calls
+    args_map = {}
+    action_requests = []
+    for tc in tcs:
+        tc_args = tc.get("args", {})
+        args_map[tc["name"]] = tc_args
+        action_requests.append(
+            {"action": tc["name"], "args": tc_args, "tool_call_id": tc["id"]}
+        )
 
     # 인터럽트 호출: 실행을 일시 중단하고 사용자 승인 요청
     # 이 함수는 사용자가 응답할 때까지 여기서 멈춥니다
     human_response = interrupt(
         {
+            # 기존 클라이언트 호환용 집계 뷰
             "action_request": {
                 "action": "tool_execution",
-                "args": {
-                    tc["name"]: tc.get("args", {}) for tc in tool_message.tool_calls
-                },
-            },
-            "config": {
-                "allow_respond": True,  # 사용자가 직접 응답 가능
-                "allow_accept": True,  # 도구 승인 가능
-                "allow_edit": True,  # 도구 인자 수정 가능
-                "allow_ignore": True,  # 도구 실행 거부 가능
+                "args": args_map,
             },
+            # 호출별 뷰 — 병렬 도구 호출을 개별 승인할 때 사용
+            "action_requests": action_requests,
+            "config": _INTERRUPT_CONFIG,
         }
     )
 
     # 사용자 응답이 없거나 형식이 잘못된 경우 종료
     if not human_response or not isinstance(human_response, list):
-        return Command(goto=END)
-
-    # 첫 번째 응답 추출 및 타입 확인
-    response = human_response[0]
-    response_type = response.get("type", "")
-    response_args = response.get("args")
-
-    # 사용자 응답 타입에 따라 분기 처리
-
-    if response_type == "accept":
-        # 승인: 도구를 원래 인자 그대로 실행
-        return Command(goto="tools")
-
-    elif response_type == "response":
-        # 응답: 도구 실행을 취소하고 사용자 메시지를 모델에 전달
-        # 도구 호출들을 취소 메시지로 변환
-        tool_responses = _create_tool_cancellations(
-            tool_message.tool_calls, "was interrupted for human input"
+        return _CMD_END
+
+    # 응답 개수가 도구 호출 개수와 같으면 호출별 결정으로 해석하고,
+    # 아니면 기존 방식대로 첫 번째 응답을 모든 호출에 적용
+    if len(human_response) == len(tcs):
+        responses = human_response
+    else:
+        responses = [human_response[0]] * len(tcs)
+
+    # 단일 패스 분류: 각 (도구 호출, 응답) 쌍을 승인/수정/취소 버킷에 배분
+    # - full_calls: AIMessage에 남길 전체 호출 목록 (수정 인자 반영)
+    # - cancellations: 취소된 호출에 대한 ToolMessage
+    # - user_messages: "response" 타입의 사용자 텍스트
+    full_calls = []
+    cancellations: list[ToolMessage] = []
+    user_messages: list[HumanMessage] = []
+    surviving = 0
+    edited = False
+
+    for tc, resp in zip(tcs, responses):
+        resp_type = resp.get("type", "")
+        resp_args = resp.get("args")
+
+        if resp_type == "accept":
+            full_calls.append(tc)
+            surviving += 1
+        elif (
+            resp_type == "edit"
+            and isinstance(resp_args, dict)
+            and "args" in resp_args
+        ):
+            updated_call = _update_tool_calls([tc], resp_args)[0]
+            full_calls.append(updated_call)
+            surviving += 1
+            edited = True
+        elif resp_type == "response":
+            full_calls.append(tc)
+            cancellations.append(
+                ToolMessage(
+                    content="Tool execution was interrupted for human input.",
+                    tool_call_id=tc["id"],
+                    name=tc["name"],
+                )
+            )
+            user_messages.append(HumanMessage(content=str(resp_args)))
+        else:  # ignore 또는 잘못된 형식
+            reason = (
+                "cancelled by human operator"
+                if resp_type == "ignore"
+                else "invalid format"
+            )
+            full_calls.append(tc)
+            cancellations.append(
+                ToolMessage(
+                    content=f"Tool execution {reason}.",
+                    tool_call_id=tc["id"],
+                    name=tc["name"],
+                )
+            )
+
+    if surviving:
+        if not cancellations and not edited:
+            # 전체 승인 (가장 흔한 경로): 상태 변경 없이 도구 실행으로 진행
+            return _CMD_TOOLS
+
+        # 일부 수정/취소: 수정 인자가 반영된 AIMessage로 교체하고, 취소된
+        # 호출에는 취소 ToolMessage를 붙입니다. 도구 노드는 아직 응답이
+        # 없는 호출만 실행하므로 취소된 호출은 재실행되지 않습니다.
+        # "response"의 사용자 텍스트는 여기서 바로 붙이지 않습니다 — 승인된
+        # 호출의 ToolMessage가 HumanMessage 뒤에 놓이면 도구 결과는 도구를
+        # 호출한 AIMessage에 연속해야 한다는 제공자 제약을 어겨 다음
+        # call_model에서 400이 나므로, tools 노드가 도구 결과 뒤에 붙이도록
+        # 대기열로 넘깁니다.
+        updated_message = AIMessage(
+            content=tool_message.content, tool_calls=full_calls, id=tool_message.id
         )
-        # 사용자의 텍스트 응답을 HumanMessage로 생성
-        human_message = HumanMessage(content=str(response_args))
-        # 취소 메시지와 사용자 메시지를 상태에 추가하고 모델 재호출
         return Command(
-            goto="call_model", update={"messages": tool_responses + [human_message]}
+            goto="tools",
+            update={
+                "messages": [updated_message, *cancellations],
+                "deferred_user_messages": user_messages,
+            },
         )
 
-    elif (
-        response_type == "edit"
-        and isinstance(response_args, dict)
-        and "args" in response_args
-    ):
-        # 수정: 도구 인자를 사용자가 제공한 값으로 업데이트 후 실행
-        updated_calls = _update_tool_calls(tool_message.tool_calls, response_args)
-        # 수정된 도구 호출로 새 AIMessage 생성
-        updated_message = AIMessage(
-            content=tool_message.content, tool_calls=updated_calls, id=tool_message.id
-        )
-        # 업데이트된 메시지로 도구 실행
-        return Command(goto="tools", update={"messages": [updated_message]})
-
-    else:  # ignore 또는 잘못된 형식
-        # 거부: 도구 실행을 취소하고 종료
-        reason = (
-            "cancelled by human operator"
-            if response_type == "ignore"
-            else "invalid format"
+    if user_messages:
+        # 전부 취소 + 사용자 텍스트 존재: 모델 재호출로 전달
+        return Command(
+            goto="call_model", update={"messages": cancellations + user_messages}
         )
-        tool_responses = _create_tool_cancellations(tool_message.tool_calls, reason)
-        return Command(goto=END, update={"messages": tool_responses})
+
+    # 전부 거부: 취소 메시지를 남기고 종료
+    return Command(goto=END, update={"messages": cancellations})
 
 
 # ---------------------------------------------------------------------------
@@ -320,7 +567,7 @@ builder = StateGraph(State, input_schema=InputState, context_schema=Context)
 
 # 그래프에서 순환할 노드들 정의
 builder.add_node(call_model)  # LLM 호출 노드
-builder.add_node("tools", ToolNode(TOOLS))  # 도구 실행 노드
+builder.add_node("tools", cached_tool_node)  # 도구 실행 노드 (결과 캐시 포함)
 builder.add_node(human_approval)  # 사용자 승인 노드 (인터럽트 지점)
 
 # 진입점을 call_model로 설정
@@ -364,8 +611,9 @@ def route_model_output(state: State) -> Literal["__end__", "human_approval"]:
 
 # call_model 노드에서 조건부 엣지 추가
 # 모델 출력을 확인하여 human_approval 또는 종료로 분기
+# path_map은 불변 튜플로 전달 (리스트와 달리 평가 시 복사가 일어나지 않음)
 builder.add_conditional_edges(
-    "call_model", route_model_output, path_map=["human_approval", END]
+    "call_model", route_model_output, path_map=("human_approval", END)
 )
 
 
@@ -376,4 +624,6 @@ builder.add_edge("tools", "call_model")
 
 # 빌더를 실행 가능한 그래프로 컴파일
 # Human-in-the-Loop 기능을 갖춘 ReAct 에이전트 완성
-graph = builder.compile(name="ReAct Agent")
+# debug=False를 명시해 Pregel의 노드별 디버그 계측이 켜지지 않도록 고정
+# (인터럽트가 일반적인 종료 경로인 HITL에서는 단계별 추적 비용이 누적됨)
+graph = builder.compile(name="ReAct Agent", debug=False)
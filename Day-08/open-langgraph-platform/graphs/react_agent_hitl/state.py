@@ -10,8 +10,14 @@
 
 상태 채널:
 - messages: 대화 메시지 히스토리 (add_messages 리듀서 사용)
+- pending_tool_msg_id: 승인 대기 중인 도구 호출 메시지의 id
 - is_last_step: 재귀 한계 도달 여부 (LangGraph 관리 변수)
 
+참고:
+    상태 객체는 매 인터럽트/재개 사이클마다 체크포인트에서 재구성되므로
+    slots=True로 정의하여 인스턴스당 __dict__ 할당을 없애고 속성 접근을
+    빠르게 합니다.
+
 사용 예:
     from react_agent_hitl.state import State, InputState
 
@@ -30,7 +36,7 @@ from langgraph.graph import add_messages
 from langgraph.managed import IsLastStep
 
 
-@dataclass
+@dataclass(slots=True)
 class InputState:
     """외부와의 인터페이스를 정의하는 에이전트 입력 상태
 
@@ -70,7 +76,7 @@ class InputState:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class State(InputState):
     """에이전트의 완전한 내부 상태를 나타내는 클래스
 
@@ -95,6 +101,28 @@ class State(InputState):
             return {"messages": [new_message]}
     """
 
+    pending_tool_msg_id: str | None = field(default=None)
+    """승인 대기 중인 도구 호출 AIMessage의 id (메시지 인덱스 사이드 채널)
+
+    call_model이 도구 호출을 포함한 응답을 반환할 때 해당 메시지의 id를
+    여기에 기록합니다. human_approval은 전체 메시지 히스토리를 역순으로
+    isinstance 검사하며 훑는 대신 이 id로 바로 대상 메시지를 찾으므로,
+    대화가 길어져도 인터럽트당 탐색 비용이 늘지 않습니다.
+
+    도구 호출이 없는 응답에서는 None으로 재설정됩니다.
+    """
+
+    deferred_user_messages: list[AnyMessage] = field(default_factory=list)
+    """도구 실행이 끝난 뒤에 히스토리에 붙일 사용자 메시지 대기열
+
+    호출별 승인에서 일부 호출은 승인되고 다른 호출이 "response"로 취소되면
+    사용자 텍스트가 생깁니다. 이를 tools 노드 이전에 추가하면 승인된
+    호출의 ToolMessage가 HumanMessage 뒤에 놓여 "모든 도구 결과는 도구를
+    호출한 AIMessage 바로 뒤에 와야 한다"는 제공자 제약을 깨뜨리므로,
+    human_approval이 여기에 보관해 두었다가 tools 노드가 도구 결과 뒤에
+    덧붙이고 비웁니다.
+    """
+
     is_last_step: IsLastStep = field(default=False)
     """재귀 한계 도달 직전 단계인지 나타내는 플래그
 
@@ -18,6 +18,10 @@ Tavily 검색 엔진을 사용하는 간단한 예제로 구성되어 있습니
     프로덕션 환경에서는 더 강력하고 특화된 도구를 구현하는 것을 권장합니다.
 """
 
+import asyncio
+import hashlib
+import json
+import time
 from collections.abc import Callable
 from typing import Any
 
@@ -25,6 +29,62 @@ from langgraph.runtime import get_runtime
 
 from react_agent_hitl.context import Context
 
+# 검색 결과 단기 메모이제이션 캐시
+# ReAct 루프는 같은 쿼리를 한 세션(또는 여러 스레드)에서 반복 발행하는
+# 일이 잦아, 캐시 히트 시 (실제 Tavily 연동 시) 네트워크 왕복 전체를
+# 절약합니다. 키는 (query, max_search_results)의 정렬 JSON을 sha256으로
+# 해시한 문자열이며, TTL로 검색 결과의 신선도를 유지합니다.
+_SEARCH_CACHE: dict[str, tuple[float, dict[str, Any] | None]] = {}
+_SEARCH_CACHE_LOCK = asyncio.Lock()
+_SEARCH_CACHE_TTL = 300.0  # 초
+_SEARCH_CACHE_MAXSIZE = 1024
+
+
+def clear_search_cache() -> None:
+    """검색 캐시 비우기 (세션 경계 등에서 호출)"""
+    _SEARCH_CACHE.clear()
+
+
+async def _cached_search(query: str, max_search_results: int) -> dict[str, Any] | None:
+    """(query, max_search_results) 키로 검색 결과를 TTL 캐싱하는 내부 헬퍼
+
+    동일 키의 동시 호출은 Lock으로 합쳐 한 번만 실행합니다.
+    runtime 컨텍스트 의존성은 호출자(search)가 미리 풀어서 전달하므로
+    이 함수는 순수하게 인자만으로 캐시 가능합니다.
+
+    Args:
+        query (str): 검색할 쿼리 문자열
+        max_search_results (int): 최대 검색 결과 개수
+
+    Returns:
+        dict[str, Any] | None: 검색 결과 딕셔너리 (search 참고)
+    """
+    key = hashlib.sha256(
+        json.dumps({"query": query, "n": max_search_results}, sort_keys=True).encode()
+    ).hexdigest()
+
+    entry = _SEARCH_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _SEARCH_CACHE_TTL:
+        return entry[1]
+
+    async with _SEARCH_CACHE_LOCK:
+        # Lock 대기 중 다른 호출이 채웠을 수 있으므로 재확인
+        entry = _SEARCH_CACHE.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _SEARCH_CACHE_TTL:
+            return entry[1]
+
+        # 실제 검색 수행 (현재는 시뮬레이션 — Tavily 연동 시 여기서 호출)
+        result: dict[str, Any] | None = {
+            "query": query,
+            "max_search_results": max_search_results,
+            "results": f"Simulated search results for '{query}'",
+        }
+
+        if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAXSIZE:
+            _SEARCH_CACHE.clear()
+        _SEARCH_CACHE[key] = (time.monotonic(), result)
+        return result
+
 
 async def search(query: str) -> dict[str, Any] | None:
     """일반 웹 검색을 수행하는 도구 함수
@@ -50,13 +110,11 @@ async def search(query: str) -> dict[str, Any] | None:
     참고:
         - 실제 프로덕션 환경에서는 Tavily API를 호출하도록 구현해야 합니다
         - Runtime[Context]를 통해 사용자별 검색 설정에 접근합니다
+        - 결과는 _cached_search가 (query, max_search_results) 키로 5분간 캐싱
     """
+    # runtime 의존성을 먼저 풀어 캐시 가능한 순수 호출로 변환
     runtime = get_runtime(Context)
-    return {
-        "query": query,
-        "max_search_results": runtime.context.max_search_results,
-        "results": f"Simulated search results for '{query}'",
-    }
+    return await _cached_search(query, runtime.context.max_search_results)
 
 
 # 에이전트가 사용할 도구 목록
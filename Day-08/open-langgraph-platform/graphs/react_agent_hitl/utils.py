@@ -17,11 +17,73 @@ LangChain 메시지 처리 및 채팅 모델 로딩을 위한 헬퍼를 포함
     model = load_chat_model("openai/gpt-4")
 """
 
+import asyncio
+import functools
+
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 
 
+class LLMBatcher:
+    """짧은 시간 창 안의 동시 LLM 호출을 하나의 abatch로 합치는 마이크로 배처
+
+    run_server처럼 여러 스레드가 동시에 call_model을 실행하는 환경에서는
+    같은 모델에 대한 ainvoke가 거의 동시에 여러 건 발생합니다. 이들을
+    작은 창(기본 5ms) 동안 모았다가 model.abatch()로 한 번에 보내면
+    TCP/TLS 셋업과 제공자 측 배칭 이점을 공유합니다. 창이 끝났을 때
+    대기 건이 하나뿐이면 그대로 ainvoke를 호출해 배칭 오버헤드를 피합니다.
+
+    사용 예:
+        response = await llm_batcher.submit(model, messages)
+    """
+
+    def __init__(self, window: float = 0.005) -> None:
+        self._window = window
+        # 모델 인스턴스(id) → [(messages, future), ...]
+        self._pending: dict[int, list[tuple[list, asyncio.Future]]] = {}
+        self._scheduled: set[int] = set()
+
+    async def submit(self, model: BaseChatModel, messages: list):
+        """모델 호출을 배치 큐에 넣고 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        key = id(model)
+        future: asyncio.Future = loop.create_future()
+        self._pending.setdefault(key, []).append((messages, future))
+        if key not in self._scheduled:
+            self._scheduled.add(key)
+            loop.create_task(self._flush(model, key))
+        return await future
+
+    async def _flush(self, model: BaseChatModel, key: int) -> None:
+        """창이 닫힌 뒤 쌓인 호출들을 한 번에 실행"""
+        await asyncio.sleep(self._window)
+        batch = self._pending.pop(key, [])
+        self._scheduled.discard(key)
+        if not batch:
+            return
+        try:
+            if len(batch) == 1:
+                # 낮은 QPS 경로: 단건이면 배칭 없이 바로 호출
+                messages, future = batch[0]
+                result = await model.ainvoke(messages)
+                if not future.done():
+                    future.set_result(result)
+                return
+            results = await model.abatch([messages for messages, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as exc:  # noqa: BLE001 - 호출자 future로 그대로 전파
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+
+
+# 프로세스 전역 배처 인스턴스 (call_model에서 공유)
+llm_batcher = LLMBatcher()
+
+
 def get_message_text(msg: BaseMessage) -> str:
     """메시지 객체에서 텍스트 콘텐츠를 추출
 
@@ -55,20 +117,30 @@ def get_message_text(msg: BaseMessage) -> str:
         text2 = get_message_text(msg2)  # "Describe this image"
     """
     content = msg.content
+    # type() is 비교는 서브클래스 구분이 필요 없는 content 요소에서
+    # isinstance보다 빠릅니다
+    content_type = type(content)
 
-    if isinstance(content, str):
+    if content_type is str:
         # 단순 문자열 콘텐츠
         return content
-    elif isinstance(content, dict):
+    if content_type is dict:
         # 딕셔너리 형식 (일반적으로 "text" 키 포함)
         return content.get("text", "")
-    else:
-        # 리스트 형식 (멀티모달 콘텐츠)
-        # 각 항목에서 텍스트만 추출하여 결합
-        txts = [c if isinstance(c, str) else (c.get("text") or "") for c in content]
-        return "".join(txts).strip()
+
+    # 리스트 형식 (멀티모달 콘텐츠)
+    if len(content) == 1:
+        # 단일 요소는 join 없이 바로 추출 (흔한 경우의 빠른 경로)
+        part = content[0]
+        return part if type(part) is str else (part.get("text") or "")
+
+    # 제너레이터 표현식으로 중간 리스트 할당 없이 스트리밍 결합
+    return "".join(
+        part if type(part) is str else (part.get("text") or "") for part in content
+    ).strip()
 
 
+@functools.lru_cache(maxsize=32)
 def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     """문자열 형식에서 채팅 모델을 로드
 
@@ -107,6 +179,9 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     참고:
         - API 키는 환경 변수를 통해 설정되어야 합니다
         - 제공자별로 필요한 패키지가 설치되어 있어야 합니다
+        - @functools.lru_cache로 메모이즈: init_chat_model은 제공자 SDK
+          임포트와 HTTP 클라이언트 생성을 수반하므로 같은 이름에 대해 1회만
+          수행하고, keep-alive 커넥션 풀을 호출 간에 재사용합니다
     """
     # 문자열을 제공자와 모델명으로 분리
     provider, model = fully_specified_name.split("/", maxsplit=1)
@@ -30,6 +30,8 @@
 - 도구 호출을 지원하는 채팅 모델 필요
 """
 
+import functools
+import time
 from datetime import UTC, datetime
 from typing import cast
 
@@ -49,6 +51,55 @@ from react_agent.utils import load_chat_model
 builder = StateGraph(State, input_schema=InputState, context_schema=Context)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_nostream_model(model_name: str):
+    """langsmith:nostream 태그가 적용된 모델을 모델명별로 1회만 구성
+
+    load_chat_model 자체는 캐시되지만 .with_config()는 호출마다 새
+    래퍼를 만들므로, 래핑 결과까지 메모이즈해 no_stream 호출마다의
+    재구성을 제거합니다.
+    """
+    return load_chat_model(model_name).with_config(
+        config={"tags": ["langsmith:nostream"]}
+    )
+
+
+# 현재 초의 ISO 타임스탬프 캐시
+# (epoch_sec, iso_str) 튜플 교체는 GIL 아래에서 원자적이므로 락 불필요.
+# datetime 객체 할당과 ISO 포맷팅이 QPS와 무관하게 초당 1회로 제한됩니다.
+_iso_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso(epoch_sec: int) -> str:
+    """초 단위 epoch에 대한 ISO 문자열 반환 (초당 1회만 생성)"""
+    global _iso_cache
+    if epoch_sec != _iso_cache[0]:
+        _iso_cache = (
+            epoch_sec,
+            datetime.fromtimestamp(epoch_sec, tz=UTC).isoformat(),
+        )
+    return _iso_cache[1]
+
+
+@functools.lru_cache(maxsize=4)
+def _format_system_prompt(template: str, now_epoch: int) -> str:
+    """시스템 프롬프트를 초 단위 시각으로 포맷한 결과를 캐시
+
+    str.format은 호출마다 포맷 문자열을 다시 파싱하고, 타임스탬프도
+    매번 새 datetime 객체와 ISO 문자열을 할당합니다. 초 단위로 내림한
+    epoch을 키에 포함하면 같은 초에 들어온 호출들이 포맷 결과 문자열
+    하나를 공유합니다 (초 미만 정밀도는 LLM에 의미가 없음).
+
+    Args:
+        template (str): {system_time} 자리를 포함한 프롬프트 템플릿
+        now_epoch (int): 초 단위로 내림한 현재 epoch 시각
+
+    Returns:
+        str: 포맷 완료된 시스템 프롬프트
+    """
+    return template.format(system_time=_now_iso(now_epoch))
+
+
 # ---------------------------------------------------------------------------
 # 노드 함수: 전처리 노드 (스트리밍 비활성화)
 # ---------------------------------------------------------------------------
@@ -85,16 +136,14 @@ async def no_stream(
           단일 완료된 응답으로 표시되도록 함
         - 서브그래프(react_agent)는 이 응답을 포함한 전체 상태를 받음
     """
-    # langsmith:nostream 태그와 함께 모델 초기화
+    # langsmith:nostream 태그와 함께 모델 초기화 (모델명별 캐시 재사용)
     # 이 태그는 LangSmith 추적 시스템에서 이 호출을 스트리밍하지 않음을 나타냄
-    model = load_chat_model(runtime.context.model).with_config(
-        config={"tags": ["langsmith:nostream"]}
-    )
+    model = _get_nostream_model(runtime.context.model)
 
-    # 시스템 프롬프트 포맷팅
+    # 시스템 프롬프트 포맷팅 (같은 초의 호출들은 캐시된 결과 공유)
     # 현재 UTC 시각을 ISO 형식으로 프롬프트에 삽입하여 시간 컨텍스트 제공
-    system_message = runtime.context.system_prompt.format(
-        system_time=datetime.now(tz=UTC).isoformat()
+    system_message = _format_system_prompt(
+        runtime.context.system_prompt, int(time.time())
     )
 
     # LLM 호출 및 응답 받기
@@ -35,9 +35,12 @@
     # DELETE /assistants/{assistant_id} - 어시스턴트 삭제
 """
 
+import hashlib
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from ..core.auth_deps import get_current_user
 from ..models import (
@@ -48,9 +51,48 @@ from ..models import (
     AssistantUpdate,
     User,
 )
-from ..services.assistant_service import AssistantService, get_assistant_service
+from ..services.assistant_service import (
+    AssistantService,
+    encode_assistant_cursor,
+    get_assistant_service,
+)
+
+# 그래프/스키마 응답은 큰 중첩 dict라 직렬화 비용이 커서, 이 라우터의
+# 기본 응답 클래스를 orjson 기반으로 교체 (stdlib json 대비 수 배 빠름)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# 버전/스키마/그래프 응답의 클라이언트 캐시 정책
+# 어시스턴트가 바뀌지 않는 한 내용이 같으므로 (version, updated_at) 기반의
+# 약한 ETag로 검증하고, 10초 동안은 재검증 없이 클라이언트 캐시를 사용하게
+# 함 (사용자별 private)
+_ETAG_CACHE_CONTROL = "private, max-age=10"
+
+
+def _version_etag(version: int, updated_at: datetime) -> str:
+    """어시스턴트의 버전 번호와 수정 시각을 약한 ETag 값으로 변환
+
+    버전 번호만 쓰면 롤백 후 번호가 과거 값 N으로 되돌아가 이전에 발급한
+    W/"N"과 충돌하므로(내용이 달라도 같은 검증자 → 잘못된 304),
+    updated_at을 함께 해시해 변경마다 검증자가 달라지게 합니다.
+    """
+    token = hashlib.blake2s(f"{version}:{updated_at}".encode(), digest_size=8).hexdigest()
+    return f'W/"{token}"'
+
 
-router = APIRouter()
+def _not_modified_or_headers(
+    request: Request, response: Response, version_info: tuple[int, datetime]
+) -> Response | None:
+    """If-None-Match가 현재 버전과 일치하면 304 응답, 아니면 캐시 헤더 설정
+
+    Returns:
+        Response | None: 304 응답 (ETag 일치 시) 또는 None (본문 생성 필요)
+    """
+    etag = _version_etag(*version_info)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _ETAG_CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _ETAG_CACHE_CONTROL
+    return None
 
 
 @router.post("/assistants", response_model=Assistant)
@@ -95,30 +137,47 @@ async def create_assistant(
 
 @router.get("/assistants", response_model=AssistantList)
 async def list_assistants(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    include_total: bool = Query(True),
     user: User = Depends(get_current_user),
     service: AssistantService = Depends(get_assistant_service),
 ) -> AssistantList:
-    """사용자의 모든 어시스턴트 목록 조회
+    """사용자의 어시스턴트 목록 조회 (페이지네이션)
 
-    인증된 사용자가 소유한 모든 어시스턴트를 반환합니다.
+    인증된 사용자가 소유한 어시스턴트를 페이지 단위로 반환합니다.
     멀티테넌트 격리를 위해 user_id로 자동 필터링됩니다.
+    전체 개수(total)는 SQL COUNT로 계산해 기본 포함합니다(기존 응답 계약
+    유지). COUNT 쿼리 비용을 아끼려는 호출자는 include_total=false로
+    생략할 수 있으며, 이때 total은 None입니다.
 
     Args:
+        limit (int): 페이지 크기 (기본값: 100, 최대 500)
+        offset (int): 건너뛸 레코드 수 (기본값: 0)
+        include_total (bool): 전체 개수 포함 여부 (기본값: True)
         user (User): 인증된 사용자 (의존성 주입)
         service (AssistantService): 어시스턴트 서비스 (의존성 주입)
 
     Returns:
-        AssistantList: 어시스턴트 목록 및 총 개수
-            - assistants: 어시스턴트 배열
-            - total: 전체 개수
+        AssistantList: 어시스턴트 목록 및 (요청 시) 총 개수
+            - assistants: 현재 페이지의 어시스턴트 배열
+            - total: 전체 개수 (include_total=false로 생략 시 None)
     """
-    assistants = await service.list_assistants(user.identity)
-    return AssistantList(assistants=assistants, total=len(assistants))
+    assistants = await service.list_assistants(
+        user.identity, limit=limit, offset=offset
+    )
+    total = (
+        await service.count_assistants(AssistantSearchRequest(), user.identity)
+        if include_total
+        else None
+    )
+    return AssistantList(assistants=assistants, total=total)
 
 
 @router.post("/assistants/search", response_model=list[Assistant])
 async def search_assistants(
     request: AssistantSearchRequest,
+    response: Response,
     user: User = Depends(get_current_user),
     service: AssistantService = Depends(get_assistant_service),
 ) -> list[Assistant]:
@@ -146,8 +205,18 @@ async def search_assistants(
 
     Returns:
         list[Assistant]: 필터링 및 페이지네이션된 어시스턴트 목록
+            - 페이지가 가득 찼으면 X-Pagination-Next-Cursor 응답 헤더에
+              다음 페이지 커서가 담김 (다음 요청의 cursor 필드에 그대로 사용)
     """
-    return await service.search_assistants(request, user.identity)
+    assistants = await service.search_assistants(request, user.identity)
+    # 키셋 커서 발급: Agent Protocol의 응답 본문(list[Assistant])은 그대로
+    # 두고 헤더로 전달. 페이지가 limit보다 작으면 마지막 페이지이므로 생략
+    if assistants and len(assistants) == (request.limit or 20):
+        last = assistants[-1]
+        response.headers["X-Pagination-Next-Cursor"] = encode_assistant_cursor(
+            last.created_at, last.assistant_id
+        )
+    return assistants
 
 
 @router.post("/assistants/count", response_model=int)
@@ -299,37 +368,58 @@ async def set_assistant_latest(
     return await service.set_assistant_latest(assistant_id, version, user.identity)
 
 
-@router.post("/assistants/{assistant_id}/versions", response_model=list[Assistant])
+# langgraph_sdk의 assistants.get_versions는 POST로 호출하므로 GET과 POST를
+# 모두 받습니다 — GET만 남기면 공식 SDK 클라이언트 전부가 405를 받게 됨
+@router.api_route(
+    "/assistants/{assistant_id}/versions",
+    methods=["GET", "POST"],
+    response_model=list[Assistant],
+)
 async def list_assistant_versions(
     assistant_id: str,
+    request: Request,
+    response: Response,
     user: User = Depends(get_current_user),
     service: AssistantService = Depends(get_assistant_service),
-) -> list[Assistant]:
+) -> Response | list[Assistant]:
     """어시스턴트의 모든 버전 이력 조회
 
     assistant_versions 테이블에 저장된 모든 버전을 최신순으로 반환합니다.
     각 버전은 과거의 설정, 그래프, 메타데이터를 보존하고 있습니다.
 
+    읽기 전용 조회이므로 캐시 가능한 GET을 제공하되, Agent Protocol /
+    langgraph_sdk 호환을 위해 기존 POST 경로도 그대로 유지합니다.
+    현재 버전을 약한 ETag로 내려 If-None-Match가 일치하면 본문 생성과
+    버전 테이블 조회 없이 304로 응답합니다.
+
     Args:
         assistant_id (str): 어시스턴트 고유 식별자
+        request (Request): HTTP 요청 (If-None-Match 헤더 확인용)
+        response (Response): HTTP 응답 (ETag/Cache-Control 설정용)
         user (User): 인증된 사용자 (의존성 주입)
         service (AssistantService): 어시스턴트 서비스 (의존성 주입)
 
     Returns:
-        list[Assistant]: 버전 목록 (최신순 정렬)
+        list[Assistant]: 버전 목록 (최신순 정렬) 또는 304 Not Modified
 
     Raises:
         HTTPException(404): 어시스턴트 또는 버전이 없음
     """
+    version_info = await service.get_assistant_version(assistant_id, user.identity)
+    if (not_modified := _not_modified_or_headers(request, response, version_info)) is not None:
+        return not_modified
     return await service.list_assistant_versions(assistant_id, user.identity)
 
 
-@router.get("/assistants/{assistant_id}/schemas")
+# 반환 타입에 Response가 섞여 있으므로 응답 모델 추론을 끔 (본문은 dict 그대로)
+@router.get("/assistants/{assistant_id}/schemas", response_model=None)
 async def get_assistant_schemas(
     assistant_id: str,
+    request: Request,
+    response: Response,
     user: User = Depends(get_current_user),
     service: AssistantService = Depends(get_assistant_service),
-) -> dict[str, Any]:
+) -> Response | dict[str, Any]:
     """어시스턴트의 그래프 스키마 조회 (5가지 타입)
 
     어시스턴트가 사용하는 LangGraph 그래프의 모든 스키마를 추출하여 반환합니다.
@@ -360,29 +450,34 @@ async def get_assistant_schemas(
         HTTPException(404): 어시스턴트를 찾을 수 없음
         HTTPException(400): 스키마 추출 실패
     """
+    # 스키마는 버전이 바뀔 때만 달라지므로 버전 기반 ETag로 304 처리
+    version_info = await service.get_assistant_version(assistant_id, user.identity)
+    if (not_modified := _not_modified_or_headers(request, response, version_info)) is not None:
+        return not_modified
     return await service.get_assistant_schemas(assistant_id, user.identity)
 
 
-@router.get("/assistants/{assistant_id}/graph")
+@router.get("/assistants/{assistant_id}/graph", response_model=None)
 async def get_assistant_graph(
     assistant_id: str,
-    xray: bool | int | None = None,
+    request: Request,
+    response: Response,
+    xray: int = Query(0, ge=0),
     user: User = Depends(get_current_user),
     service: AssistantService = Depends(get_assistant_service),
-) -> dict[str, Any]:
+) -> Response | dict[str, Any]:
     """그래프 구조 조회 (시각화용)
 
     어시스턴트의 LangGraph 그래프 구조를 JSON 형식으로 반환합니다.
     노드, 엣지, 조건부 분기 등 그래프의 전체 구조를 시각화할 수 있습니다.
 
     xray 파라미터:
-    - False (기본값): 최상위 그래프 구조만 반환
-    - True: 모든 서브그래프까지 완전히 펼침
-    - int (양수): 특정 깊이만큼만 펼침
+    - 0 (기본값): 최상위 그래프 구조만 반환
+    - 양수 N: 서브그래프를 깊이 N까지 펼침 (충분히 큰 값이면 완전히 펼침)
 
     Args:
         assistant_id (str): 어시스턴트 고유 식별자
-        xray (bool | int | None): 서브그래프 펼침 옵션 (기본값: False)
+        xray (int): 서브그래프 펼침 깊이 (기본값: 0, Query(ge=0)으로 음수 차단)
         user (User): 인증된 사용자 (의존성 주입)
         service (AssistantService): 어시스턴트 서비스 (의존성 주입)
 
@@ -394,9 +489,11 @@ async def get_assistant_graph(
         HTTPException(422): xray 값이 유효하지 않거나 그래프가 시각화를 지원하지 않음
         HTTPException(400): 그래프 조회 실패
     """
-    # xray가 None이면 기본값 False로 설정 (최상위 그래프만 반환)
-    xray_value = xray if xray is not None else False
-    return await service.get_assistant_graph(assistant_id, xray_value, user.identity)
+    # 그래프 구조도 버전이 바뀔 때만 달라지므로 버전 기반 ETag로 304 처리
+    version_info = await service.get_assistant_version(assistant_id, user.identity)
+    if (not_modified := _not_modified_or_headers(request, response, version_info)) is not None:
+        return not_modified
+    return await service.get_assistant_graph(assistant_id, xray, user.identity)
 
 
 @router.get("/assistants/{assistant_id}/subgraphs")
@@ -187,8 +187,9 @@ class AssistantList(BaseModel):
     # 현재 페이지의 어시스턴트 목록
     assistants: list[Assistant]
 
-    # 검색 조건에 맞는 전체 어시스턴트 개수
-    total: int
+    # 검색 조건에 맞는 전체 어시스턴트 개수 (기본 포함;
+    # include_total=false로 COUNT 쿼리를 생략한 경우에만 None)
+    total: int | None = None
 
 
 class AssistantSearchRequest(BaseModel):
@@ -229,8 +230,17 @@ class AssistantSearchRequest(BaseModel):
     limit: int | None = Field(20, le=100, ge=1, description="Maximum results")
 
     # 시작 오프셋 (0 이상, 기본값: 0)
+    # 깊은 페이지에서는 cursor 사용을 권장 (OFFSET은 건너뛴 행만큼 느려짐)
     offset: int | None = Field(0, ge=0, description="Results offset")
 
+    # 키셋(커서) 페이지네이션: 마지막으로 받은 어시스턴트의
+    # (created_at, assistant_id)를 인코딩한 값. 지정 시 offset은 무시되며
+    # 페이지 깊이와 무관하게 일정한 비용으로 다음 페이지를 가져옵니다.
+    cursor: str | None = Field(
+        None,
+        description="Keyset pagination cursor (from the last assistant of the previous page); takes precedence over offset",
+    )
+
     # 메타데이터로 필터링 (JSONB 쿼리)
     metadata: dict[str, Any] | None = Field(
         {}, description="Metadata to use for searching and filtering assistants."
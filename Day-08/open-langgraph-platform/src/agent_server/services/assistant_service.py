@@ -20,6 +20,8 @@
 • get_assistant_service() - FastAPI 의존성 주입 헬퍼
 """
 
+import asyncio
+import base64
 import uuid
 from datetime import UTC, datetime
 from typing import Any, cast
@@ -27,7 +29,7 @@ from uuid import uuid4
 
 from fastapi import Depends, HTTPException
 from langgraph.graph.state import CompiledStateGraph
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import func, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.orm import Assistant as AssistantORM
@@ -146,6 +148,11 @@ def _extract_graph_schemas(graph: CompiledGraph) -> dict[str, Any]:
     그래프의 입력, 출력, 상태, 설정, 컨텍스트 스키마를 JSON 형식으로 추출합니다.
     각 스키마 추출은 독립적으로 시도하며, 실패 시 None으로 설정됩니다.
 
+    Pydantic 모델 → JSON Schema 변환은 순수 CPU 작업으로 복잡한 상태 스키마에서
+    수십 ms까지 걸릴 수 있습니다. 동기 함수이므로 비동기 경로에서는
+    asyncio.to_thread로 감싸 이벤트 루프를 막지 않게 호출하세요
+    (캐시 미스 시에만 실행되므로 스레드 전환 비용은 무시 가능).
+
     Args:
         graph: 컴파일된 LangGraph 그래프 객체
 
@@ -191,6 +198,106 @@ def _extract_graph_schemas(graph: CompiledGraph) -> dict[str, Any]:
     }
 
 
+def encode_assistant_cursor(created_at: datetime, assistant_id: str) -> str:
+    """어시스턴트의 (created_at, assistant_id)를 검색 커서로 인코딩
+
+    클라이언트는 받은 페이지의 마지막 어시스턴트로 이 커서를 만들어
+    다음 검색 요청의 cursor 필드에 넣으면 OFFSET 없이 이어서 조회합니다.
+
+    Args:
+        created_at (datetime): 마지막 어시스턴트의 생성 시각
+        assistant_id (str): 마지막 어시스턴트의 ID
+
+    Returns:
+        str: base64 인코딩된 커서 문자열
+    """
+    return base64.urlsafe_b64encode(
+        f"{created_at.isoformat()}|{assistant_id}".encode()
+    ).decode()
+
+
+def _decode_assistant_cursor(cursor: str) -> tuple[datetime, str]:
+    """검색 커서를 (created_at, assistant_id) 튜플로 복원
+
+    Raises:
+        HTTPException(422): 커서 형식이 잘못된 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, _, assistant_id = raw.partition("|")
+        return datetime.fromisoformat(timestamp), assistant_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(422, "Invalid search cursor") from e
+
+
+def _apply_search_filters(stmt, request: AssistantSearchRequest):
+    """검색/개수 쿼리에 공통 필터 조건을 적용
+
+    search_assistants()와 count_assistants()가 정확히 같은 WHERE 절을
+    공유하도록 필터 구성을 한 곳으로 모았습니다. 모든 조건은 SQL로
+    내려가며(파라미터 바인딩), 애플리케이션 계층에서는 행을 거르지
+    않습니다 — 전송되는 행 수가 결과 페이지 크기로 제한됩니다.
+
+    Args:
+        stmt: 조건을 덧붙일 select 문
+        request (AssistantSearchRequest): 검색 필터
+
+    Returns:
+        조건이 적용된 select 문
+    """
+    if request.name:
+        # 부분 일치 검색 (대소문자 무시)
+        # ILIKE 대신 lower() LIKE 형태로 작성 — pg_trgm 표현식 인덱스
+        # (lower(name) gin_trgm_ops)와 정확히 일치해 인덱스 스캔이 가능
+        stmt = stmt.where(func.lower(AssistantORM.name).like(f"%{request.name.lower()}%"))
+
+    if request.description:
+        # 부분 일치 검색 (대소문자 무시) — name과 동일한 인덱스 매칭 형태
+        stmt = stmt.where(
+            func.lower(AssistantORM.description).like(f"%{request.description.lower()}%")
+        )
+
+    if request.graph_id:
+        # 그래프 ID 정확히 일치
+        stmt = stmt.where(AssistantORM.graph_id == request.graph_id)
+
+    if request.metadata:
+        metadata_filter = (
+            dict(request.metadata) if isinstance(request.metadata, dict) else request.metadata
+        )
+        if isinstance(metadata_filter, dict):
+            # JSONB 포함 연산자(@>) — GIN 인덱스를 탈 수 있는 형태
+            stmt = stmt.where(AssistantORM.metadata_dict.op("@>")(metadata_filter))
+
+    return stmt
+
+
+# 스키마/그래프 응답 캐시
+# 그래프 정의는 프로세스 수명 동안 불변이고, 어시스턴트 응답은 version이
+# 바뀔 때만 달라집니다. (assistant_id, version, ...) 키로 이미 직렬화된
+# dict를 저장하면 반복 조회 시 Pydantic/JSON 스키마 생성을 건너뜁니다.
+# 키에 version이 포함되어 변경 시 자동 무효화되지만, 쓰기 경로에서도
+# 명시적으로 제거해 캐시가 오래된 키로 부풀지 않게 합니다.
+_SCHEMA_CACHE: dict[tuple, dict] = {}
+_SCHEMA_CACHE_MAXSIZE = 256
+
+# xray 깊이가 이 값 이상이면 "완전 펼침"(True) 센티널로 해석
+_XRAY_FULL = 2**31 - 1
+
+
+def _invalidate_assistant_cache(assistant_id: str) -> None:
+    """해당 어시스턴트의 캐시된 스키마/그래프 응답 제거 (쓰기 경로에서 호출)"""
+    for key in [k for k in _SCHEMA_CACHE if k[0] == assistant_id]:
+        _SCHEMA_CACHE.pop(key, None)
+
+
+def _schema_cache_put(key: tuple, value: dict) -> None:
+    """캐시에 저장 (상한 도달 시 전체 비움 — 엔트리가 작고 재계산이 싸므로 충분)"""
+    if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_MAXSIZE:
+        _SCHEMA_CACHE.clear()
+    _SCHEMA_CACHE[key] = value
+
+
 class AssistantService:
     """어시스턴트 관리 서비스
 
@@ -210,6 +317,9 @@ class AssistantService:
         langgraph_service (LangGraphService): LangGraph 서비스 인스턴스
     """
 
+    # 요청마다 생성되는 객체이므로 __slots__로 인스턴스 dict 할당 생략
+    __slots__ = ("session", "langgraph_service")
+
     def __init__(self, session: AsyncSession, langgraph_service: LangGraphService):
         """AssistantService 초기화
 
@@ -343,20 +453,32 @@ class AssistantService:
 
         return to_pydantic(assistant_orm)
 
-    async def list_assistants(self, user_identity: str) -> list[Assistant]:
-        """사용자의 모든 어시스턴트 조회
+    async def list_assistants(
+        self, user_identity: str, limit: int = 100, offset: int = 0
+    ) -> list[Assistant]:
+        """사용자의 어시스턴트 조회 (페이지네이션)
 
-        인증된 사용자가 소유한 모든 어시스턴트를 반환합니다.
+        인증된 사용자가 소유한 어시스턴트를 페이지 단위로 반환합니다.
         멀티테넌트 격리를 위해 user_id로 필터링합니다.
+        LIMIT/OFFSET을 SQL로 내려보내 전체 테이블을 역직렬화하지 않으며,
+        페이지가 결정적이도록 검색과 같은 정렬 기준을 사용합니다.
 
         Args:
             user_identity (str): 사용자 식별자
+            limit (int): 페이지 크기 (기본값: 100)
+            offset (int): 건너뛸 레코드 수 (기본값: 0)
 
         Returns:
-            list[Assistant]: 사용자의 어시스턴트 목록
+            list[Assistant]: 현재 페이지의 어시스턴트 목록
         """
         # 사용자 소유 어시스턴트만 필터링
-        stmt = select(AssistantORM).where(AssistantORM.user_id == user_identity)
+        stmt = (
+            select(AssistantORM)
+            .where(AssistantORM.user_id == user_identity)
+            .order_by(AssistantORM.created_at.desc(), AssistantORM.assistant_id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.session.scalars(stmt)
         user_assistants = [to_pydantic(a) for a in result.all()]
         return user_assistants
@@ -380,33 +502,32 @@ class AssistantService:
         Returns:
             list[Assistant]: 필터링 및 페이지네이션된 어시스턴트 목록
         """
-        # 사용자의 어시스턴트를 기반으로 시작
-        stmt = select(AssistantORM).where(AssistantORM.user_id == user_identity)
-
-        # 필터 적용
-        if request.name:
-            # 부분 일치 검색 (대소문자 무시)
-            stmt = stmt.where(AssistantORM.name.ilike(f"%{request.name}%"))
-
-        if request.description:
-            # 부분 일치 검색 (대소문자 무시)
-            stmt = stmt.where(AssistantORM.description.ilike(f"%{request.description}%"))
+        # 사용자의 어시스턴트를 기반으로 시작 + 공통 필터 적용 (전부 SQL로 푸시)
+        stmt = _apply_search_filters(
+            select(AssistantORM).where(AssistantORM.user_id == user_identity), request
+        )
 
-        if request.graph_id:
-            # 그래프 ID 정확히 일치
-            stmt = stmt.where(AssistantORM.graph_id == request.graph_id)
+        # 결정적 정렬 후 페이지네이션 적용 — ORDER BY 없는 OFFSET/LIMIT은
+        # 플랜에 따라 페이지 간 행이 중복되거나 누락될 수 있음
+        limit = request.limit or 20
+        stmt = stmt.order_by(
+            AssistantORM.created_at.desc(), AssistantORM.assistant_id.desc()
+        )
 
-        if request.metadata:
-            metadata_filter = (
-                dict(request.metadata) if isinstance(request.metadata, dict) else request.metadata
+        if request.cursor:
+            # 키셋 페이지네이션: 행 값 비교는 복합 인덱스
+            # (user_id, created_at DESC, assistant_id DESC)를 Index Cond로
+            # 사용하므로 페이지 깊이와 무관하게 일정 비용
+            cursor_ts, cursor_id = _decode_assistant_cursor(request.cursor)
+            stmt = stmt.where(
+                tuple_(AssistantORM.created_at, AssistantORM.assistant_id)
+                < (cursor_ts, cursor_id)
             )
-            if isinstance(metadata_filter, dict):
-                stmt = stmt.where(AssistantORM.metadata_dict.op("@>")(metadata_filter))
+        else:
+            # 하위 호환: 커서가 없으면 기존 OFFSET 방식 유지
+            stmt = stmt.offset(request.offset or 0)
 
-        # 페이지네이션 적용
-        offset = request.offset or 0
-        limit = request.limit or 20
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = stmt.limit(limit)
 
         result = await self.session.scalars(stmt)
         paginated_assistants = [to_pydantic(a) for a in result.all()]
@@ -426,24 +547,14 @@ class AssistantService:
         Returns:
             int: 필터 조건을 만족하는 어시스턴트 총 개수
         """
-        stmt = select(func.count()).where(AssistantORM.user_id == user_identity)
-
-        # search_assistants()와 동일한 필터 적용
-        if request.name:
-            stmt = stmt.where(AssistantORM.name.ilike(f"%{request.name}%"))
-
-        if request.description:
-            stmt = stmt.where(AssistantORM.description.ilike(f"%{request.description}%"))
-
-        if request.graph_id:
-            stmt = stmt.where(AssistantORM.graph_id == request.graph_id)
-
-        if request.metadata:
-            metadata_filter = (
-                dict(request.metadata) if isinstance(request.metadata, dict) else request.metadata
-            )
-            if isinstance(metadata_filter, dict):
-                stmt = stmt.where(AssistantORM.metadata_dict.op("@>")(metadata_filter))
+        # search_assistants()와 동일한 필터를 공유 헬퍼로 적용한 count(*)
+        # (목록 쿼리를 재사용해 len()을 세지 않음 — 행 전송 없이 DB가 집계)
+        stmt = _apply_search_filters(
+            select(func.count())
+            .select_from(AssistantORM)
+            .where(AssistantORM.user_id == user_identity),
+            request,
+        )
 
         total = await self.session.scalar(stmt)
         return total or 0
@@ -578,6 +689,8 @@ class AssistantService:
         )
         await self.session.execute(assistant_update)
         await self.session.commit()
+        # 버전이 바뀌었으므로 캐시된 스키마/그래프 응답 무효화
+        _invalidate_assistant_cache(assistant_id)
         updated_assistant = await self.session.scalar(stmt)
         if updated_assistant is None:
             raise HTTPException(500, f"Assistant '{assistant_id}' was updated but could not be reloaded")
@@ -611,6 +724,7 @@ class AssistantService:
         # CASCADE DELETE로 버전 이력, 실행, 이벤트도 함께 삭제됨
         await self.session.delete(assistant)
         await self.session.commit()
+        _invalidate_assistant_cache(assistant_id)
 
         return {"status": "deleted"}
 
@@ -620,10 +734,10 @@ class AssistantService:
         assistant_versions 테이블에 저장된 과거 버전을 어시스턴트의 최신 버전으로 설정합니다.
         이 기능을 통해 사용자는 이전 설정이나 그래프로 롤백할 수 있습니다.
 
-        동작 흐름:
-        1. 어시스턴트 존재 여부 확인
-        2. 요청된 버전 존재 여부 확인
-        3. 어시스턴트 메인 레코드를 해당 버전의 내용으로 업데이트
+        기존에는 존재 확인 SELECT → 버전 SELECT → UPDATE → 재조회 SELECT의
+        4회 왕복이었지만, 버전 테이블을 조인한 UPDATE ... FROM과 RETURNING을
+        사용해 한 번의 왕복으로 줄였습니다. 갱신된 행이 0개면 어시스턴트
+        또는 버전이 없는 것이므로 실패 경로에서만 원인을 구분 조회합니다.
 
         Args:
             assistant_id (str): 어시스턴트 고유 식별자
@@ -636,49 +750,73 @@ class AssistantService:
         Raises:
             HTTPException(404): 어시스턴트 또는 버전을 찾을 수 없음
         """
-        stmt = select(AssistantORM).where(
-            AssistantORM.assistant_id == assistant_id,
-            AssistantORM.user_id == user_identity,
-        )
-        assistant = await self.session.scalar(stmt)
-        if not assistant:
-            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
-
-        # 요청된 버전 조회
-        version_stmt = select(AssistantVersionORM).where(
-            AssistantVersionORM.assistant_id == assistant_id,
-            AssistantVersionORM.version == version,
-        )
-        assistant_version = await self.session.scalar(version_stmt)
-        if not assistant_version:
-            raise HTTPException(404, f"Version '{version}' for Assistant '{assistant_id}' not found")
-
-        # 어시스턴트를 해당 버전의 내용으로 업데이트
+        # UPDATE ... FROM assistant_versions ... RETURNING으로 존재 확인,
+        # 버전 조회, 갱신, 재조회를 단일 쿼리에 융합
         assistant_update = (
             update(AssistantORM)
             .where(
                 AssistantORM.assistant_id == assistant_id,
                 AssistantORM.user_id == user_identity,
+                AssistantVersionORM.assistant_id == AssistantORM.assistant_id,
+                AssistantVersionORM.version == version,
             )
             .values(
-                name=assistant_version.name,
-                description=assistant_version.description,
-                config=assistant_version.config,
-                context=assistant_version.context,
-                graph_id=assistant_version.graph_id,
+                name=AssistantVersionORM.name,
+                description=AssistantVersionORM.description,
+                config=AssistantVersionORM.config,
+                context=AssistantVersionORM.context,
+                graph_id=AssistantVersionORM.graph_id,
                 version=version,
                 updated_at=datetime.now(UTC),
             )
+            .returning(AssistantORM)
         )
-        await self.session.execute(assistant_update)
-        await self.session.commit()
-        updated_assistant = await self.session.scalar(stmt)
+        result = await self.session.execute(assistant_update)
+        updated_assistant = result.scalars().first()
         if updated_assistant is None:
-            raise HTTPException(
-                500,
-                f"Assistant '{assistant_id}' was updated but could not be reloaded",
+            await self.session.rollback()
+            # 실패 경로에서만 원인을 구분해 기존 오류 메시지 유지
+            exists_stmt = select(AssistantORM.assistant_id).where(
+                AssistantORM.assistant_id == assistant_id,
+                AssistantORM.user_id == user_identity,
             )
-        return to_pydantic(updated_assistant)
+            if await self.session.scalar(exists_stmt) is None:
+                raise HTTPException(404, f"Assistant '{assistant_id}' not found")
+            raise HTTPException(404, f"Version '{version}' for Assistant '{assistant_id}' not found")
+
+        pydantic_assistant = to_pydantic(updated_assistant)
+        await self.session.commit()
+        # 복원된 버전 기준으로 캐시된 스키마/그래프 응답 무효화
+        _invalidate_assistant_cache(assistant_id)
+        return pydantic_assistant
+
+    async def get_assistant_version(self, assistant_id: str, user_identity: str) -> tuple[int, datetime]:
+        """어시스턴트의 현재 버전 번호와 수정 시각 조회
+
+        두 컬럼만 읽는 가벼운 쿼리로, 라우트에서 ETag 검증 등 실제 응답
+        생성 전에 변경 여부를 싸게 확인할 때 사용합니다. 버전 번호는
+        롤백(set_assistant_latest) 시 과거 값으로 되돌아가 단독으로는
+        검증자로 쓸 수 없으므로, 매 변경마다 갱신되는 updated_at을 함께
+        반환합니다.
+
+        Args:
+            assistant_id (str): 어시스턴트 고유 식별자
+            user_identity (str): 사용자 식별자
+
+        Returns:
+            tuple[int, datetime]: (현재 버전 번호, 마지막 수정 시각)
+
+        Raises:
+            HTTPException(404): 어시스턴트를 찾을 수 없음
+        """
+        stmt = select(AssistantORM.version, AssistantORM.updated_at).where(
+            AssistantORM.assistant_id == assistant_id,
+            or_(AssistantORM.user_id == user_identity, AssistantORM.user_id == "system"),
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
+        return row.version, row.updated_at
 
     async def list_assistant_versions(self, assistant_id: str, user_identity: str) -> list[Assistant]:
         """어시스턴트의 모든 버전 이력 조회
@@ -770,33 +908,43 @@ class AssistantService:
         if not assistant:
             raise HTTPException(404, f"Assistant '{assistant_id}' not found")
 
+        # 스키마는 (어시스턴트, 버전)별로 불변 — 캐시 히트 시 그래프 로드와
+        # 스키마 추출(순수 CPU 작업)을 모두 생략
+        cache_key = (assistant_id, assistant.version, "schemas")
+        cached = _SCHEMA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             graph = cast(
                 "CompiledGraph",
                 await self.langgraph_service.get_graph(assistant.graph_id),
             )
             compiled_graph = cast("CompiledGraph", graph)
-            schemas = _extract_graph_schemas(compiled_graph)
+            # JSON Schema 생성은 CPU 바운드 — 워커 스레드로 옮겨
+            # 같은 루프에서 실행 중인 다른 요청/스트림이 멈추지 않게 함
+            schemas = await asyncio.to_thread(_extract_graph_schemas, compiled_graph)
 
-            return {"graph_id": assistant.graph_id, **schemas}
+            result = {"graph_id": assistant.graph_id, **schemas}
+            _schema_cache_put(cache_key, result)
+            return result
 
         except Exception as e:
             raise HTTPException(400, f"Failed to extract schemas: {str(e)}") from e
 
-    async def get_assistant_graph(self, assistant_id: str, xray: bool | int, user_identity: str) -> dict:
+    async def get_assistant_graph(self, assistant_id: str, xray: int, user_identity: str) -> dict:
         """그래프 구조 조회 (시각화용)
 
         어시스턴트의 LangGraph 그래프 구조를 JSON 형식으로 반환합니다.
         노드, 엣지, 조건부 분기 등 그래프의 전체 구조를 시각화할 수 있습니다.
 
         xray 파라미터:
-        - False (기본값): 최상위 그래프 구조만 반환
-        - True: 모든 서브그래프까지 완전히 펼침
-        - int (양수): 특정 깊이만큼만 펼침
+        - 0 (기본값): 최상위 그래프 구조만 반환
+        - 양수 N: 서브그래프를 깊이 N까지 펼침 (_XRAY_FULL 이상이면 완전히 펼침)
 
         Args:
             assistant_id (str): 어시스턴트 고유 식별자
-            xray (bool | int): 서브그래프 펼침 옵션
+            xray (int): 서브그래프 펼침 깊이 (라우트의 Query(ge=0)이 음수를 차단)
             user_identity (str): 사용자 식별자
 
         Returns:
@@ -816,16 +964,26 @@ class AssistantService:
         if not assistant:
             raise HTTPException(404, f"Assistant '{assistant_id}' not found")
 
+        # 그래프 구조도 (어시스턴트, 버전, xray)별로 불변
+        cache_key = (assistant_id, assistant.version, "graph", xray)
+        cached = _SCHEMA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             graph = await self.langgraph_service.get_graph(assistant.graph_id)
 
-            # xray가 정수인 경우 (boolean이 아님) 양수 검증
-            if isinstance(xray, int) and not isinstance(xray, bool) and xray <= 0:
+            # 라우트의 Query(ge=0)가 음수를 거르지만, 서비스가 직접 호출될
+            # 수도 있으므로 방어적으로 한 번 더 검증 (422 계약 유지)
+            if xray < 0:
                 raise HTTPException(422, detail="Invalid xray value")
 
+            # 0 → 펼침 없음, _XRAY_FULL 이상 → 완전 펼침, 그 외 → 깊이 그대로
+            xray_arg: bool | int = False if xray == 0 else (True if xray >= _XRAY_FULL else xray)
+
             try:
                 # LangGraph의 aget_graph()로 시각화 가능한 그래프 구조 추출
-                drawable_graph = await graph.aget_graph(xray=xray)
+                drawable_graph = await graph.aget_graph(xray=xray_arg)
                 json_graph = drawable_graph.to_json()
 
                 # 노드 데이터에서 불필요한 id 필드 제거
@@ -833,6 +991,7 @@ class AssistantService:
                     if (data := node.get("data")) and isinstance(data, dict):
                         data.pop("id", None)
 
+                _schema_cache_put(cache_key, json_graph)
                 return json_graph
             except NotImplementedError as e:
                 raise HTTPException(422, detail="The graph does not support visualization") from e
@@ -885,8 +1044,11 @@ class AssistantService:
 
             try:
                 # 서브그래프 순회하며 각각의 스키마 추출
+                # (추출은 CPU 바운드이므로 서브그래프별로 워커 스레드에서 수행)
                 subgraphs = {
-                    ns: _extract_graph_schemas(cast("CompiledGraph", subgraph))
+                    ns: await asyncio.to_thread(
+                        _extract_graph_schemas, cast("CompiledGraph", subgraph)
+                    )
                     async for ns, subgraph in graph.aget_subgraphs(namespace=namespace, recurse=recurse)
                 }
                 return subgraphs
@@ -916,6 +1078,11 @@ def get_assistant_service(
         ):
             return await service.create_assistant(request, user.identity)
 
+    요청 상태(세션)를 들고 있으므로 프로세스 싱글톤으로 만들 수는 없고,
+    대신 모듈 최상위의 일반 함수로 유지해 FastAPI의 요청 단위 의존성
+    캐시(use_cache=True 기본값)가 항상 적중하도록 합니다 — 한 요청이
+    여러 Depends에서 이 함수를 참조해도 서비스는 한 번만 생성됩니다.
+
     Args:
         session (AsyncSession): 데이터베이스 세션 (자동 주입)
         langgraph_service (LangGraphService): LangGraph 서비스 (자동 주입)
@@ -4,6 +4,7 @@ This file contains shared fixtures and configuration that are available
 to all tests across the test suite.
 """
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
@@ -85,7 +86,10 @@ def basic_session():
 @pytest.fixture
 def mock_assistant_service():
     """Fixture providing a mocked assistant service"""
-    return AsyncMock()
+    service = AsyncMock()
+    # ETag routes unpack (version, updated_at); a bare Mock would blow up there
+    service.get_assistant_version.return_value = (1, datetime.now(UTC))
+    return service
 
 
 @pytest.fixture
@@ -109,6 +109,8 @@ class TestListAssistants:
             make_assistant("asst-3", "Assistant 3", "graph-1"),
         ]
         mock_assistant_service.list_assistants.return_value = assistants
+        # total is computed by a separate SQL COUNT now, not len() of the page
+        mock_assistant_service.count_assistants.return_value = 3
 
         resp = client.get("/assistants")
 
@@ -123,6 +125,7 @@ class TestListAssistants:
     def test_list_assistants_empty(self, client, mock_assistant_service):
         """Test listing assistants when user has none"""
         mock_assistant_service.list_assistants.return_value = []
+        mock_assistant_service.count_assistants.return_value = 0
 
         resp = client.get("/assistants")
 
@@ -602,7 +605,7 @@ class TestSetLatestAssistant:
 
 
 class TestListAssistantVersions:
-    """Test POST /assistants/{assistant_id}/versions"""
+    """Test GET/POST /assistants/{assistant_id}/versions"""
 
     def test_list_assistant_versions(self, client, mock_assistant_service):
         """Test listing all versions of assistant"""
@@ -616,7 +619,7 @@ class TestListAssistantVersions:
         versions[2].version = 3
         mock_assistant_service.list_assistant_versions.return_value = versions
 
-        resp = client.post("/assistants/test-assistant-123/versions")
+        resp = client.get("/assistants/test-assistant-123/versions")
 
         assert resp.status_code == 200
         data = resp.json()
@@ -625,11 +628,24 @@ class TestListAssistantVersions:
         assert data[0]["version"] == 1
         assert data[2]["version"] == 3
 
+    def test_list_assistant_versions_post_compat(self, client, mock_assistant_service):
+        """Test that the POST route used by langgraph_sdk still works"""
+        versions = [make_assistant(name="V1")]
+        versions[0].version = 1
+        mock_assistant_service.list_assistant_versions.return_value = versions
+
+        resp = client.post("/assistants/test-assistant-123/versions", json={})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data) == 1
+        assert data[0]["version"] == 1
+
     def test_list_assistant_versions_empty(self, client, mock_assistant_service):
         """Test listing versions when there are none"""
         mock_assistant_service.list_assistant_versions.return_value = []
 
-        resp = client.post("/assistants/test-assistant-123/versions")
+        resp = client.get("/assistants/test-assistant-123/versions")
 
         assert resp.status_code == 200
         data = resp.json()
@@ -683,7 +699,7 @@ class TestGetAssistantGraph:
         graph = {"graph": {"nodes": [], "edges": []}}
         mock_assistant_service.get_assistant_graph.return_value = graph
 
-        resp = client.get("/assistants/test-assistant-123/graph?xray=true")
+        resp = client.get("/assistants/test-assistant-123/graph?xray=1")
 
         assert resp.status_code == 200
         data = resp.json()
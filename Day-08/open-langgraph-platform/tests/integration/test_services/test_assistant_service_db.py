@@ -226,6 +226,7 @@ class TestAssistantServiceDatabase:
         mock_request.description = None
         mock_request.graph_id = None
         mock_request.metadata = None
+        mock_request.cursor = None
         mock_request.offset = 2
         mock_request.limit = 2
 
@@ -304,26 +305,24 @@ class TestAssistantServiceDatabase:
         )
         assistant = await assistant_service.create_assistant(create_request, "user-123")
 
-        # Mock scalar calls: assistant, version, updated assistant
-        from agent_server.core.orm import AssistantVersion as AssistantVersionORM
-
-        version_obj = AssistantVersionORM(
+        # Mock the row returned by the fused UPDATE ... RETURNING round-trip
+        updated_row = AssistantORM(
             assistant_id=assistant.assistant_id,
-            version=2,
             name="Version 2",
             description="Second version",
             graph_id="test-graph",
             config={"model": "gpt-4"},
             context={},
             metadata_dict={},
+            user_id="user-123",
+            version=2,
             created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
         )
 
-        assistant_service.session.scalar.side_effect = [
-            assistant,
-            version_obj,
-            assistant,
-        ]
+        mock_result = Mock()
+        mock_result.scalars.return_value.first.return_value = updated_row
+        assistant_service.session.execute.return_value = mock_result
 
         result = await assistant_service.set_assistant_latest(
             assistant.assistant_id, 2, "user-123"
@@ -358,6 +357,7 @@ class TestAssistantServiceDatabase:
         mock_request.description = None
         mock_request.graph_id = None
         mock_request.metadata = {"env": "prod"}
+        mock_request.cursor = None
         mock_request.offset = 0
         mock_request.limit = 10
 
@@ -718,20 +718,10 @@ class TestAssistantServiceVersionManagement:
         mock_assistant.context = {}
         mock_assistant.metadata_dict = {}
 
-        # Mock existing version
-        mock_version = Mock()
-        mock_version.name = "Version Name"
-        mock_version.description = "Version Description"
-        mock_version.config = {"key": "value"}
-        mock_version.context = {"ctx": "val"}
-        mock_version.graph_id = "test-graph"
-
-        assistant_service.session.scalar.side_effect = [
-            mock_assistant,
-            mock_version,
-            mock_assistant,
-        ]
-        assistant_service.session.execute = AsyncMock()
+        # Mock the UPDATE ... RETURNING round-trip returning the updated row
+        mock_result = Mock()
+        mock_result.scalars.return_value.first.return_value = mock_assistant
+        assistant_service.session.execute = AsyncMock(return_value=mock_result)
         assistant_service.session.commit = AsyncMock()
 
         result = await assistant_service.set_assistant_latest("test-id", 2, "user-123")
@@ -743,6 +733,11 @@ class TestAssistantServiceVersionManagement:
     @pytest.mark.asyncio
     async def test_set_assistant_latest_assistant_not_found(self, assistant_service):
         """Test setting latest version for non-existent assistant"""
+        # UPDATE matches no rows, and the follow-up existence probe misses too
+        mock_result = Mock()
+        mock_result.scalars.return_value.first.return_value = None
+        assistant_service.session.execute = AsyncMock(return_value=mock_result)
+        assistant_service.session.rollback = AsyncMock()
         assistant_service.session.scalar.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
@@ -754,11 +749,12 @@ class TestAssistantServiceVersionManagement:
     @pytest.mark.asyncio
     async def test_set_assistant_latest_version_not_found(self, assistant_service):
         """Test setting non-existent version as latest"""
-        # Mock existing assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-
-        assistant_service.session.scalar.side_effect = [mock_assistant, None]
+        # UPDATE matches no rows, but the assistant itself exists
+        mock_result = Mock()
+        mock_result.scalars.return_value.first.return_value = None
+        assistant_service.session.execute = AsyncMock(return_value=mock_result)
+        assistant_service.session.rollback = AsyncMock()
+        assistant_service.session.scalar.return_value = "test-id"
 
         with pytest.raises(HTTPException) as exc_info:
             await assistant_service.set_assistant_latest("test-id", 999, "user-123")
@@ -781,6 +777,7 @@ class TestAssistantServiceSearch:
         mock_request.description = "description"
         mock_request.graph_id = "graph-1"
         mock_request.metadata = {"env": "test"}
+        mock_request.cursor = None
         mock_request.offset = 0
         mock_request.limit = 10
 